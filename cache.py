@@ -7,10 +7,14 @@ import yt_dlp
 import os
 import threading
 import logging
+import logging.handlers
+import queue
 import sys
 import datetime
+import time
 import re
 import requests
+import requests.adapters
 import subprocess
 import shutil
 import http.server
@@ -21,7 +25,17 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.mime.base import MIMEBase
 from email import encoders
+import email.utils
 import socket
+import errno
+import atexit
+import signal
+import contextlib
+import functools
+import concurrent.futures
+import gzip
+import itertools
+import mmap
 from urllib.parse import urljoin, urlparse
 try:
     from bs4 import BeautifulSoup
@@ -35,23 +49,84 @@ try:
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import msgpack
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
 # Debug mode flag - set to True to show all messages including heartbeat
 DEBUG_MODE = False
 
+# Where cached videos, webpages, logs and settings live
+CACHE_DIR = Path.home() / "Downloads" / "mucache" / "data"
+SETTINGS_FILE = CACHE_DIR / "settings.json"
+
+# Seconds to coalesce playlist/redownload queue changes before writing to disk
+PLAYLIST_FLUSH_DELAY = 0.25
+
+# With msgpack, playlist.json is also re-exported this often (seconds) while it is stale,
+# so a killed process leaves it at most this far behind playlist.msgpack
+PLAYLIST_EXPORT_INTERVAL = 5 * 60
+
+# yt-dlp metadata cache: entries expire after a day, oldest evicted past the cap
+METADATA_CACHE_TTL = 24 * 60 * 60
+METADATA_CACHE_MAX_ENTRIES = 3000
+
+# Buffer size for streaming downloaded video files to disk
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+SENDFILE_CHUNK_SIZE = 8 * 1024 * 1024
+DOWNLOAD_COPY_SIZE = 4 * 1024 * 1024
+DOWNLOAD_PROGRESS_INTERVAL = 5.0
+
+# Largest POST bodies accepted; report requests carry free-form case metadata
+MAX_SETTINGS_POST_SIZE = 4 * 1024
+MAX_POST_SIZE = 64 * 1024
+MAX_REPORT_POST_SIZE = 1024 * 1024
+POST_READ_CHUNK_SIZE = 64 * 1024
+
 # Import our new modules with error handling
 try:
-    from evidence_generator import EvidenceGenerator
-    from citation_generator import CitationGenerator
+    from evidence_generator import EvidenceGenerator, create_evidence_report
+    from citation_generator import CitationGenerator, generate_video_citations
     EVIDENCE_CITATION_AVAILABLE = True
 except ImportError as e:
     if DEBUG_MODE:
         print(f"Warning: Evidence/Citation generators not available: {e}")
     EvidenceGenerator = None
     CitationGenerator = None
+    create_evidence_report = None
+    generate_video_citations = None
     EVIDENCE_CITATION_AVAILABLE = False
 
+# Background listener that performs the actual console/file log writes
+_log_listener = None
+
+def stop_log_listener():
+    """Flush queued log records and stop the background listener."""
+    global _log_listener
+    if _log_listener is not None:
+        try:
+            _log_listener.stop()
+        except Exception:
+            pass
+        _log_listener = None
+
+atexit.register(stop_log_listener)
+
 def setup_logging(cache_dir):
-    """Set up logging to redirect output to log files with error handling."""
+    """Set up logging to redirect output to log files with error handling.
+    
+    The app logger only enqueues records; a QueueListener thread writes them
+    to the console and app.log so logging never blocks a download.
+    """
+    global _log_listener
     try:
         logs_dir = cache_dir / "logs"
         logs_dir.mkdir(exist_ok=True)
@@ -60,8 +135,10 @@ def setup_logging(cache_dir):
         # Clear any existing handlers
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
+        stop_log_listener()
             
         logger.setLevel(logging.INFO)
+        handlers = []
         
         # Add console handler for immediate feedback (but filter what shows)
         console_handler = logging.StreamHandler(sys.stdout)
@@ -74,18 +151,24 @@ def setup_logging(cache_dir):
         else:
             console_handler.setLevel(logging.ERROR)
         
-        logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # Add file handler (detailed logging - always capture everything)
         try:
             file_handler = logging.FileHandler(logs_dir / 'app.log', encoding='utf-8')
             file_handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
             file_handler.setLevel(logging.INFO)  # File gets everything
-            logger.addHandler(file_handler)
+            handlers.append(file_handler)
         except Exception as e:
             if DEBUG_MODE:
                 print(f"Warning: Could not create log file: {e}")
         
+        # Hand records to a background thread instead of writing inline
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        _log_listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _log_listener.start()
+        
         # Log detailed startup info 
         logger.info("=== Application Starting ===")
         logger.info(f"Cache directory: {cache_dir}")
@@ -102,6 +185,16 @@ def setup_logging(cache_dir):
         logger.addHandler(handler)
         return logger
 
+def get_debug_log_path(logger):
+    """Return logs/debug.log next to the app log file, or None if there is no log file."""
+    handlers = list(logger.handlers) if logger and hasattr(logger, 'handlers') else []
+    if _log_listener is not None:
+        handlers.extend(_log_listener.handlers)
+    for handler in handlers:
+        if hasattr(handler, 'baseFilename'):
+            return Path(handler.baseFilename).parent / 'debug.log'
+    return None
+
 def safe_log(logger, level, message, console_only=False):
     """Log messages safely, handling non-ASCII characters with console control."""
     if logger is None:
@@ -148,27 +241,146 @@ def console_status(message):
     """Display status messages on console only (not in log files)."""
     print(message)
 
+# Files at least this large are parsed straight from a memory map instead of a bytes copy
+MMAP_READ_THRESHOLD = 1024 * 1024
+
+@contextlib.contextmanager
+def mapped_file(path):
+    """Yield a read-only buffer with path's contents, memory-mapped for large files."""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < MMAP_READ_THRESHOLD:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                yield view
+            finally:
+                view.release()
+
+def read_json_file(path):
+    """Load a JSON file, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        # orjson parses any buffer, so large files skip the intermediate bytes copy
+        with mapped_file(path) as data:
+            return orjson.loads(data)
+    with open(path, 'rb') as f:
+        return json.loads(f.read())
+
+def load_json_bytes(data):
+    """Parse JSON from bytes, using orjson when it is installed."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def dump_json_bytes(data, compact=False):
+    """Serialize data to UTF-8 JSON bytes, 2-space indented unless compact is set."""
+    if ORJSON_AVAILABLE:
+        if compact:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    if compact:
+        return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def atomic_write_bytes(path, data):
+    """Write bytes to a temp file and swap it into place so a crash never leaves a partial file."""
+    path = Path(path)
+    tmp_path = path.with_name(path.name + '.tmp')
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(str(tmp_path), str(path))
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+        raise
+
+def write_json_file(path, data):
+    """Atomically write data to a JSON file with 2-space indentation, using orjson when it is installed."""
+    atomic_write_bytes(path, dump_json_bytes(data))
+
+class BackgroundFileWriter:
+    """Write files on a single daemon thread so callers never block on disk I/O.
+    
+    Only the newest pending data for each path is kept, so a burst of saves
+    to the same file ends up as one write.
+    """
+    
+    def __init__(self):
+        self._pending = {}
+        self._busy = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name='mucache-file-writer', daemon=True)
+        self._thread.start()
+    
+    def submit(self, path, data, mtime=None):
+        """Queue bytes to be written to path, replacing any write still pending for it.
+        
+        When mtime is given the written file is stamped with it, so files
+        written as a set can carry identical modification times.
+        """
+        with self._cond:
+            self._pending[path] = (data, mtime)
+            self._cond.notify_all()
+    
+    def wait(self, timeout=None):
+        """Block until every queued write has reached disk."""
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._pending and not self._busy, timeout)
+    
+    def _run(self):
+        while True:
+            with self._cond:
+                self._cond.wait_for(lambda: self._pending)
+                batch = self._pending
+                self._pending = {}
+                self._busy = True
+            for path, (data, mtime) in batch.items():
+                try:
+                    atomic_write_bytes(path, data)
+                    if mtime is not None:
+                        os.utime(str(path), (mtime, mtime))
+                except Exception as e:
+                    if DEBUG_MODE:
+                        print(f"Error writing {path}: {e}")
+            with self._cond:
+                self._busy = False
+                self._cond.notify_all()
+
+_file_writer = None
+_file_writer_lock = threading.Lock()
+
+def get_file_writer():
+    """Return the process-wide background file writer, starting it on first use."""
+    global _file_writer
+    with _file_writer_lock:
+        if _file_writer is None:
+            _file_writer = BackgroundFileWriter()
+        return _file_writer
+
+# Extensions the player can serve from the cache directory
+_PLAYABLE_VIDEO_SUFFIXES = frozenset(('.mp4', '.webm', '.avi'))
+
+# Windows invalid characters (including slashes) plus parentheses that can cause issues
+_INVALID_FILENAME_CHARS = b'<>:"|?*\\/()'
+_FILENAME_BYTE_TABLE = bytes.maketrans(_INVALID_FILENAME_CHARS, b' ' * len(_INVALID_FILENAME_CHARS))
+_MULTI_SPACE_RE = re.compile(r' {2,}')
+
+@functools.lru_cache(maxsize=4096)
 def sanitize_filename(filename):
     """Replace special characters with spaces for Windows compatibility."""
     try:
-        # Replace non-ASCII characters with spaces
-        safe_name = ""
-        for c in filename:
-            if ord(c) < 128:
-                safe_name += c
-            else:
-                safe_name += " "
-        
-        # Replace Windows invalid characters including forward slashes
-        for char in '<>:"|?*\\/':
-            safe_name = safe_name.replace(char, " ")
-        
-        # Replace parentheses that can cause issues
-        safe_name = safe_name.replace('(', ' ').replace(')', ' ')
+        # Replace non-ASCII characters with '?', which the invalid-char pass turns into spaces,
+        # then replace Windows invalid characters and parentheses with a 256-entry byte table
+        safe_name = filename.encode('ascii', 'replace').translate(_FILENAME_BYTE_TABLE).decode('ascii')
         
         # Collapse multiple spaces
-        while "  " in safe_name:
-            safe_name = safe_name.replace("  ", " ")
+        safe_name = _MULTI_SPACE_RE.sub(' ', safe_name)
         
         return safe_name.strip()
     except Exception as e:
@@ -176,10 +388,23 @@ def sanitize_filename(filename):
             print(f"Error sanitizing filename: {e}")
         return "sanitized_filename"
 
+def is_ascii(text):
+    """Return True if text is pure ASCII (str.isascii() needs Python 3.7)."""
+    try:
+        text.encode('ascii')
+    except UnicodeEncodeError:
+        return False
+    return True
+
+@functools.lru_cache(maxsize=1)
 def check_ffmpeg_available():
-    """Check if FFmpeg is available on the system."""
+    """Check if FFmpeg is available on the system (cached for the process)."""
     try:
-        subprocess.run(['ffmpeg', '-version'], 
+        # PATH lookup first so a missing FFmpeg never costs a fork/exec
+        ffmpeg_path = shutil.which('ffmpeg')
+        if ffmpeg_path is None:
+            return False
+        subprocess.run([ffmpeg_path, '-version'], 
                       stdout=subprocess.DEVNULL, 
                       stderr=subprocess.DEVNULL, 
                       check=True)
@@ -191,14 +416,28 @@ def check_ffmpeg_available():
             print(f"Error checking FFmpeg: {e}")
         return False
 
+# Parsed settings.json, reloaded only when the file's mtime changes
+_settings_cache = None
+_settings_mtime = None
+_settings_lock = threading.Lock()
+
+def load_settings(settings_file):
+    """Return the parsed settings file, re-reading it only when it has changed on disk."""
+    global _settings_cache, _settings_mtime
+    try:
+        mtime = settings_file.stat().st_mtime
+    except FileNotFoundError:
+        return {}
+    with _settings_lock:
+        if _settings_cache is None or mtime != _settings_mtime:
+            _settings_cache = read_json_file(settings_file)
+            _settings_mtime = mtime
+        return _settings_cache
+
 def get_quality_preference():
     """Get quality preference from settings file or return default."""
     try:
-        settings_file = Path.home() / "Downloads" / "mucache" / "data" / "settings.json"
-        if settings_file.exists():
-            with open(settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                return settings.get('quality_preference', 'reliable')
+        return load_settings(SETTINGS_FILE).get('quality_preference', 'reliable')
     except Exception as e:
         if DEBUG_MODE:
             print(f"Error reading quality preference: {e}")
@@ -206,28 +445,61 @@ def get_quality_preference():
 
 def save_quality_preference(preference):
     """Save quality preference to settings file."""
+    global _settings_cache, _settings_mtime
     try:
-        settings_file = Path.home() / "Downloads" / "mucache" / "data" / "settings.json"
+        settings_file = SETTINGS_FILE
         settings_file.parent.mkdir(parents=True, exist_ok=True)
         
         settings = {}
-        if settings_file.exists():
-            try:
-                with open(settings_file, 'r', encoding='utf-8') as f:
-                    settings = json.load(f)
-            except Exception as e:
-                if DEBUG_MODE:
-                    print(f"Warning: Could not read existing settings: {e}")
+        try:
+            settings = dict(load_settings(settings_file))
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Warning: Could not read existing settings: {e}")
         
         settings['quality_preference'] = preference
-        with open(settings_file, 'w', encoding='utf-8') as f:
-            json.dump(settings, f, indent=2)
+        
+        # Write to a temp file and swap it in so readers never see a partial file
+        write_json_file(settings_file, settings)
+        
+        with _settings_lock:
+            _settings_cache = settings
+            _settings_mtime = settings_file.stat().st_mtime
         return True
     except Exception as e:
         if DEBUG_MODE:
             print(f"Error saving settings: {e}")
         return False
 
+# yt-dlp format selectors tried in order for each quality preference
+_FORMATS_HIGH_BASE = (
+    'best[height<=1080][ext=mp4]+best[ext=m4a]/best[height<=1080][ext=mp4]',  # 1080p with audio merge
+    'best[height<=720][ext=mp4]+best[ext=m4a]/best[height<=720][ext=mp4]',   # 720p with audio merge
+    'best[height<=480][ext=mp4]+best[ext=m4a]/best[height<=480][ext=mp4]',   # 480p with audio merge
+    'best[ext=mp4]',  # Best MP4 format (may require merging)
+)
+_FORMATS_HIGH = _FORMATS_HIGH_BASE + (
+    '18',  # Fallback to reliable 360p
+    'worst[ext=mp4]',
+    'best'
+)
+_FORMATS_MEDIUM = (
+    '22',  # 720p MP4 (if available as combined)
+    '18',  # 360p MP4 (reliable)
+    'best[height<=720][ext=mp4]',  # 720p MP4 video-only
+    'best[height<=480][ext=mp4]',  # 480p MP4 video-only
+    'worst[ext=mp4]',
+    'best'
+)
+_FORMATS_RELIABLE = (
+    '18',  # 360p MP4 (most reliable)
+    'worst[ext=mp4][height>=360]',  # Lowest quality MP4 that's at least 360p
+    'best[height<=480][ext=mp4]',  # 480p fallback
+    'worst[ext=mp4]',
+    'best'
+)
+_FORMATS_FALLBACK = ('18', 'worst', 'best')
+
 class FFmpegPlugin:
     """Optional FFmpeg plugin for high-quality downloads with audio/video merging."""
     
@@ -245,12 +517,7 @@ class FFmpegPlugin:
     
     def get_high_quality_formats(self):
         """Get format options when FFmpeg is available."""
-        return [
-            'best[height<=1080][ext=mp4]+best[ext=m4a]/best[height<=1080][ext=mp4]',  # 1080p with audio merge
-            'best[height<=720][ext=mp4]+best[ext=m4a]/best[height<=720][ext=mp4]',   # 720p with audio merge
-            'best[height<=480][ext=mp4]+best[ext=m4a]/best[height<=480][ext=mp4]',   # 480p with audio merge
-            'best[ext=mp4]',  # Best MP4 format (may require merging)
-        ]
+        return _FORMATS_HIGH_BASE
     
     def get_ytdl_options(self, base_options):
         """Get yt-dlp options when FFmpeg is available."""
@@ -268,6 +535,102 @@ class FFmpegPlugin:
                 safe_log(self.logger, 'error', f"Error setting FFmpeg options: {e}")
         return base_options
 
+class MetadataCache:
+    """On-disk cache of per-URL yt-dlp metadata with a TTL and a size cap.
+    
+    Entries look like {url: {'ts': <epoch seconds>, <field>: <value>, ...}}.
+    When the cache grows past max_entries the oldest entries are evicted.
+    """
+    
+    def __init__(self, cache_file, ttl=METADATA_CACHE_TTL, max_entries=METADATA_CACHE_MAX_ENTRIES):
+        self.cache_file = cache_file
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self.entries = {}
+        try:
+            if cache_file.exists():
+                self.entries = read_json_file(cache_file)
+        except Exception as e:
+            if DEBUG_MODE:
+                print(f"Warning: Could not load metadata cache: {e}")
+            self.entries = {}
+    
+    def get(self, url, field):
+        """Return a cached field for url, or None if missing or expired."""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or field not in entry:
+                return None
+            if time.time() - entry.get('ts', 0) > self.ttl:
+                del self.entries[url]
+                return None
+            return entry[field]
+    
+    def put(self, url, field, value):
+        """Store a field for url and persist the cache in the background."""
+        with self._lock:
+            entry = self.entries.setdefault(url, {})
+            entry[field] = value
+            entry['ts'] = time.time()
+            if len(self.entries) > self.max_entries:
+                oldest = sorted(self.entries, key=lambda u: self.entries[u].get('ts', 0))
+                for old_url in oldest[:len(self.entries) - self.max_entries]:
+                    del self.entries[old_url]
+            data = dump_json_bytes(self.entries, compact=True)
+        get_file_writer().submit(self.cache_file, data)
+    
+    def clear(self):
+        """Drop every cached entry and overwrite the cache file with an empty cache."""
+        with self._lock:
+            self.entries = {}
+            data = dump_json_bytes(self.entries, compact=True)
+        get_file_writer().submit(self.cache_file, data)
+
+# Process-wide metadata cache, set up by main(); probes go to the network when unset
+_metadata_cache = None
+
+def set_metadata_cache(cache):
+    """Install the MetadataCache used by extract_video_info()."""
+    global _metadata_cache
+    _metadata_cache = cache
+
+def clear_metadata_cache():
+    """Forget all cached metadata so the next probe of every URL hits the network."""
+    if _metadata_cache is not None:
+        _metadata_cache.clear()
+
+# Only the fields the downloaders read are cached, not the full formats list
+_CACHED_INFO_FIELDS = ('id', 'title', 'duration', 'uploader', 'upload_date')
+
+# Options for metadata-only yt-dlp probes. Each thread keeps one extractor
+# around instead of building a new YoutubeDL for every download.
+_YDL_INFO_OPTIONS = {
+    'skip_download': True,
+    'quiet': True,
+    'no_warnings': True
+}
+_ydl_info_local = threading.local()
+
+def extract_video_info(url):
+    """Return yt-dlp metadata for url without downloading it.
+    
+    URLs probed within the metadata cache's TTL are answered from the cache
+    with a trimmed dict holding _CACHED_INFO_FIELDS.
+    """
+    metadata_cache = _metadata_cache
+    if metadata_cache is not None:
+        cached_info = metadata_cache.get(url, 'info')
+        if cached_info is not None:
+            return cached_info
+    ydl = getattr(_ydl_info_local, 'ydl', None)
+    if ydl is None:
+        ydl = _ydl_info_local.ydl = yt_dlp.YoutubeDL(dict(_YDL_INFO_OPTIONS))
+    info = ydl.extract_info(url, download=False)
+    if metadata_cache is not None and info:
+        metadata_cache.put(url, 'info', {field: info[field] for field in _CACHED_INFO_FIELDS if field in info})
+    return info
+
 def check_available_formats(url, logger=None):
     """Check what formats are available for a given URL."""
     try:
@@ -307,14 +670,7 @@ def execute_ytdlp_debug_command(command, url, logger=None):
     """Execute yt-dlp debug commands safely and return output."""
     try:
         # Set up debug logging to separate file
-        debug_log_path = None
-        if logger and hasattr(logger, 'handlers'):
-            # Get the log directory from the main logger
-            for handler in logger.handlers:
-                if hasattr(handler, 'baseFilename'):
-                    log_dir = Path(handler.baseFilename).parent
-                    debug_log_path = log_dir / 'debug.log'
-                    break
+        debug_log_path = get_debug_log_path(logger)
 
         # Clear debug log at start of each session
         if debug_log_path:
@@ -512,14 +868,7 @@ def execute_mhtml_debug_command(command, url, logger=None):
     """Execute MHTML/webpage debug commands safely and return output."""
     try:
         # Set up debug logging to separate file
-        debug_log_path = None
-        if logger and hasattr(logger, 'handlers'):
-            # Get the log directory from the main logger
-            for handler in logger.handlers:
-                if hasattr(handler, 'baseFilename'):
-                    log_dir = Path(handler.baseFilename).parent
-                    debug_log_path = log_dir / 'debug.log'
-                    break
+        debug_log_path = get_debug_log_path(logger)
 
         # Clear debug log at start of each session
         if debug_log_path:
@@ -577,8 +926,7 @@ def execute_mhtml_debug_command(command, url, logger=None):
 
         elif command == 'test-connection':
             try:
-                import requests
-                response = requests.head(url, timeout=10, allow_redirects=True)
+                response = _HTTP_SESSION.head(url, timeout=10, allow_redirects=True)
                 output_lines.append(f"✅ Connection successful: {response.status_code}")
                 output_lines.append(f"📋 Content-Type: {response.headers.get('content-type', 'unknown')}")
                 output_lines.append(f"📏 Content-Length: {response.headers.get('content-length', 'unknown')}")
@@ -588,8 +936,7 @@ def execute_mhtml_debug_command(command, url, logger=None):
 
         elif command == 'test-headers':
             try:
-                import requests
-                response = requests.head(url, timeout=10, allow_redirects=True)
+                response = _HTTP_SESSION.head(url, timeout=10, allow_redirects=True)
                 output_lines.append(f"📋 Headers for {url}:")
                 for key, value in response.headers.items():
                     output_lines.append(f"  {key}: {value}")
@@ -599,8 +946,7 @@ def execute_mhtml_debug_command(command, url, logger=None):
 
         elif command == 'test-content':
             try:
-                import requests
-                response = requests.get(url, timeout=15)
+                response = _HTTP_SESSION.get(url, timeout=15)
                 content_preview = response.text[:500]
                 output_lines.append(f"✅ Content preview (first 500 chars):")
                 output_lines.append(content_preview)
@@ -851,63 +1197,66 @@ def get_format_options(quality_preference, ffmpeg_plugin):
     try:
         if quality_preference == 'high' and ffmpeg_plugin.available:
             # High quality with FFmpeg
-            formats = ffmpeg_plugin.get_high_quality_formats()
-            formats.extend([
-                '18',  # Fallback to reliable 360p
-                'worst[ext=mp4]',
-                'best'
-            ])
-            return formats
-        
+            return _FORMATS_HIGH
         elif quality_preference == 'medium':
             # Medium quality - try some higher formats without requiring FFmpeg
-            return [
-                '22',  # 720p MP4 (if available as combined)
-                '18',  # 360p MP4 (reliable)
-                'best[height<=720][ext=mp4]',  # 720p MP4 video-only
-                'best[height<=480][ext=mp4]',  # 480p MP4 video-only
-                'worst[ext=mp4]',
-                'best'
-            ]
-        
+            return _FORMATS_MEDIUM
         else:  # 'reliable' or default
             # Reliable quality - prioritize formats that always work
-            return [
-                '18',  # 360p MP4 (most reliable)
-                'worst[ext=mp4][height>=360]',  # Lowest quality MP4 that's at least 360p
-                'best[height<=480][ext=mp4]',  # 480p fallback
-                'worst[ext=mp4]',
-                'best'
-            ]
+            return _FORMATS_RELIABLE
     except Exception as e:
         if DEBUG_MODE:
             print(f"Error getting format options: {e}")
-        return ['18', 'worst', 'best']  # Safe fallback
+        return _FORMATS_FALLBACK  # Safe fallback
 
 class VideoManager:
     def __init__(self, cache_dir):
+        # Write-behind state: mutations mark the store dirty and a short timer
+        # coalesces them into a single file write.
+        self._lock = threading.RLock()
+        # Notified on every version bump; /events streams wait on it
+        self._changed = threading.Condition(self._lock)
+        self._dirty_playlist = False
+        self._dirty_queue = False
+        self._flush_timer = None
+        self._export_timer = None
+        # True when playlist.msgpack holds changes not yet exported to playlist.json
+        self._json_stale = False
+        # filename -> url, for reverse lookups without scanning the playlist
+        self._by_filename = {}
+        # Bumped on every playlist change; keys the cached /playlist response
+        self.version = 0
+        self._sorted_videos = []
+        self._sorted_videos_version = -1
+        self._playlist_json = None
+        self._playlist_json_version = -1
+        self._playlist_gzip = None
+        self._playlist_gzip_version = -1
+        atexit.register(self.close)
+
         try:
             self.cache_dir = cache_dir
             self.playlist_file = cache_dir / 'playlist.json'
+            # Binary primary store when msgpack is installed; playlist.json becomes an export
+            self.playlist_store = cache_dir / 'playlist.msgpack'
             self.redownload_file = cache_dir / 'redownload_queue.json'
             
             # Load playlist with error handling
             self.videos = {}
-            if self.playlist_file.exists():
-                try:
-                    with open(self.playlist_file, 'r', encoding='utf-8') as f:
-                        self.videos = json.load(f)
-                except Exception as e:
-                    if DEBUG_MODE:
-                        print(f"Warning: Could not load playlist: {e}")
-                    self.videos = {}
+            try:
+                self.videos = self._compact_entries(self._load_playlist())
+                if self._json_stale:
+                    self._schedule_export()
+            except Exception as e:
+                if DEBUG_MODE:
+                    print(f"Warning: Could not load playlist: {e}")
+                self.videos = {}
             
             # Load redownload queue with error handling
             self.redownload_queue = {}
             if self.redownload_file.exists():
                 try:
-                    with open(self.redownload_file, 'r', encoding='utf-8') as f:
-                        self.redownload_queue = json.load(f)
+                    self.redownload_queue = read_json_file(self.redownload_file)
                 except Exception as e:
                     if DEBUG_MODE:
                         print(f"Warning: Could not load redownload queue: {e}")
@@ -917,6 +1266,45 @@ class VideoManager:
             traceback.print_exc()
             self.videos = {}
             self.redownload_queue = {}
+        self._by_filename = {data['filename']: url for url, data in self.videos.items()
+                             if isinstance(data, dict) and 'filename' in data}
+
+    def _load_playlist(self):
+        """Load the playlist, preferring playlist.msgpack when it is at least as new as the JSON."""
+        json_mtime = self.playlist_file.stat().st_mtime if self.playlist_file.exists() else None
+        if MSGPACK_AVAILABLE and self.playlist_store.exists():
+            store_mtime = self.playlist_store.stat().st_mtime
+            if json_mtime is None or store_mtime >= json_mtime:
+                try:
+                    with mapped_file(self.playlist_store) as data:
+                        videos = msgpack.unpackb(data, raw=False)
+                    self._json_stale = json_mtime is None or store_mtime > json_mtime
+                    return videos
+                except Exception as e:
+                    if DEBUG_MODE:
+                        print(f"Warning: Could not load playlist.msgpack, using JSON: {e}")
+        if json_mtime is not None:
+            return read_json_file(self.playlist_file)
+        return {}
+
+    @staticmethod
+    def _compact_entries(videos):
+        """Share one copy of each entry key and platform name across the playlist.
+        
+        Decoders (msgpack in particular) allocate a fresh string for every key
+        and value, so a large playlist otherwise holds thousands of identical
+        'title'/'filename'/'platform' strings.
+        """
+        for url, data in videos.items():
+            if not isinstance(data, dict):
+                continue
+            compact = {sys.intern(key): value for key, value in data.items()}
+            platform = compact.get('platform')
+            if isinstance(platform, str):
+                compact['platform'] = sys.intern(platform)
+            # Replacing the value of an existing key does not resize the dict
+            videos[url] = compact
+        return videos
 
     def add_video(self, url, title, filename, platform=None):
         try:
@@ -936,33 +1324,48 @@ class VideoManager:
                 elif "c-span.org" in url:
                     platform = "CSPAN"
 
-            self.videos[url] = {'title': title, 'filename': filename, 'platform': platform}
-            with open(self.playlist_file, 'w', encoding='utf-8') as f:
-                json.dump(self.videos, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                previous = self.videos.get(url)
+                if previous is not None:
+                    self._by_filename.pop(previous.get('filename'), None)
+                self.videos[url] = {'title': title, 'filename': filename, 'platform': platform}
+                self._by_filename[filename] = url
+                self._dirty_playlist = True
+                self.version += 1
+                self._changed.notify_all()
+            self._schedule_flush()
         except Exception as e:
             if DEBUG_MODE:
                 print(f"Error adding video to playlist: {e}")
 
+    def get_video_by_filename(self, filename):
+        """Return the playlist entry stored under filename, or None."""
+        with self._lock:
+            url = self._by_filename.get(filename)
+            return self.videos.get(url) if url is not None else None
+
     def remove_video(self, url, logger=None):
         """Remove a video from the playlist and try to delete the file."""
         try:
-            if url in self.videos:
-                filename = self.videos[url]['filename']
-                # Remove from playlist first
-                video_info = self.videos[url].copy()
-                del self.videos[url]
-                
-                try:
-                    with open(self.playlist_file, 'w', encoding='utf-8') as f:
-                        json.dump(self.videos, f, indent=2, ensure_ascii=False)
-                except Exception as e:
-                    if logger: safe_log(logger, 'error', f"Error saving playlist: {e}")
+            # Remove from playlist first
+            with self._lock:
+                video_data = self.videos.pop(url, None)
+                if video_data is not None:
+                    self._by_filename.pop(video_data.get('filename'), None)
+                    self._dirty_playlist = True
+                    self.version += 1
+                    self._changed.notify_all()
+            if video_data is not None:
+                filename = video_data['filename']
+                self._schedule_flush()
                 
-                # Try to delete file with both original and sanitized names
-                file_paths = [
-                    self.cache_dir / filename,
-                    self.cache_dir / sanitize_filename(filename)
-                ]
+                # Try to delete file with both original and sanitized names,
+                # skipping the second stat when sanitizing changes nothing
+                sanitized_filename = sanitize_filename(filename)
+                if sanitized_filename == filename:
+                    file_paths = (self.cache_dir / filename,)
+                else:
+                    file_paths = (self.cache_dir / filename, self.cache_dir / sanitized_filename)
                 
                 deleted = False
                 for file_path in file_paths:
@@ -989,15 +1392,17 @@ class VideoManager:
 
     def add_to_redownload_queue(self, url, title, original_filename, logger=None):
         try:
-            self.redownload_queue[url] = {
-                'title': title, 
-                'original_filename': original_filename,
-                'timestamp': datetime.datetime.now().isoformat()
-            }
+            with self._lock:
+                self.redownload_queue[url] = {
+                    'title': title, 
+                    'original_filename': original_filename,
+                    # ISO 8601 local time straight from the C formatter, no datetime object
+                    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+                }
+                self._dirty_queue = True
             if logger and DEBUG_MODE: 
                 safe_log(logger, 'info', f"Added to redownload queue: {title}")
-            with open(self.redownload_file, 'w', encoding='utf-8') as f:
-                json.dump(self.redownload_queue, f, indent=2, ensure_ascii=False)
+            self._schedule_flush()
         except Exception as e:
             if logger: safe_log(logger, 'error', f"Error adding to redownload queue: {e}")
 
@@ -1007,9 +1412,10 @@ class VideoManager:
     def remove_from_redownload_queue(self, url):
         try:
             if url in self.redownload_queue:
-                del self.redownload_queue[url]
-                with open(self.redownload_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.redownload_queue, f, indent=2, ensure_ascii=False)
+                with self._lock:
+                    del self.redownload_queue[url]
+                    self._dirty_queue = True
+                self._schedule_flush()
                 return True
             return False
         except Exception as e:
@@ -1021,43 +1427,70 @@ class VideoManager:
         """Check playlist integrity and fix filename mismatches."""
         try:
             repaired = False
+            
+            # List the cache directory once instead of once per missing entry
+            existing_names = set()
+            video_stems = {}  # lowercase stem -> file name
+            video_files = []  # (lowercase stem, file name) in directory order
+            with os.scandir(self.cache_dir) as entries:
+                for entry in entries:
+                    if not entry.is_file():
+                        continue
+                    existing_names.add(entry.name)
+                    stem, suffix = os.path.splitext(entry.name)
+                    if suffix in _PLAYABLE_VIDEO_SUFFIXES:
+                        video_stems.setdefault(stem.lower(), entry.name)
+                        video_files.append((stem.lower(), entry.name))
+            
             for url, video_data in list(self.videos.items()):
                 filename = video_data['filename']
                 file_path = self.cache_dir / filename
                 
                 # If file doesn't exist, try to find it with sanitized name
-                if not file_path.exists():
+                if filename not in existing_names and not file_path.exists():
                     # Try sanitized version
                     sanitized_filename = sanitize_filename(filename)
                     sanitized_path = self.cache_dir / sanitized_filename
                     
-                    if sanitized_path.exists():
+                    if sanitized_filename in existing_names or sanitized_path.exists():
                         # Update playlist with correct filename
                         self.videos[url]['filename'] = sanitized_filename
+                        self._by_filename.pop(filename, None)
+                        self._by_filename[sanitized_filename] = url
                         repaired = True
                         if logger:
                             safe_log(logger, 'info', f"Repaired playlist entry: {filename} -> {sanitized_filename}")
                     else:
                         # Try to find similar files
                         base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
-                        sanitized_base = sanitize_filename(base_name)
+                        base_lower = base_name.lower()
+                        sanitized_lower = sanitize_filename(base_name).lower()
                         
-                        for existing_file in self.cache_dir.iterdir():
-                            if existing_file.is_file() and existing_file.suffix in ['.mp4', '.webm', '.avi']:
-                                existing_base = existing_file.stem
-                                if (sanitized_base.lower() in existing_base.lower() or 
-                                    existing_base.lower() in sanitized_base.lower() or
-                                    base_name.lower() in existing_base.lower()):
-                                    self.videos[url]['filename'] = existing_file.name
-                                    repaired = True
-                                    if logger:
-                                        safe_log(logger, 'info', f"Repaired playlist entry: {filename} -> {existing_file.name}")
+                        # Exact stem hit first, then a single substring pass over the listing
+                        match_name = video_stems.get(sanitized_lower) or video_stems.get(base_lower)
+                        if match_name is None:
+                            for existing_lower, existing_name in video_files:
+                                if (sanitized_lower in existing_lower or 
+                                    existing_lower in sanitized_lower or
+                                    base_lower in existing_lower):
+                                    match_name = existing_name
                                     break
+                        
+                        if match_name is not None:
+                            self.videos[url]['filename'] = match_name
+                            self._by_filename.pop(filename, None)
+                            self._by_filename[match_name] = url
+                            repaired = True
+                            if logger:
+                                safe_log(logger, 'info', f"Repaired playlist entry: {filename} -> {match_name}")
             
             if repaired:
                 # Save the repaired playlist
-                with open(self.playlist_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.videos, f, indent=2, ensure_ascii=False)
+                with self._lock:
+                    self._dirty_playlist = True
+                    self.version += 1
+                    self._changed.notify_all()
+                self.flush()
                 if logger:
                     safe_log(logger, 'info', "Playlist repaired and saved")
                     
@@ -1065,19 +1498,132 @@ class VideoManager:
             if logger:
                 safe_log(logger, 'error', f"Error repairing playlist: {e}")
 
+    def _schedule_flush(self):
+        """Schedule a debounced write of any dirty state."""
+        with self._lock:
+            if self._flush_timer is not None:
+                return
+            self._flush_timer = threading.Timer(PLAYLIST_FLUSH_DELAY, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def _schedule_export(self):
+        """Schedule a playlist.json export so it does not wait for shutdown."""
+        with self._lock:
+            if self._export_timer is not None:
+                return
+            self._export_timer = threading.Timer(PLAYLIST_EXPORT_INTERVAL, self.export_playlist_json)
+            self._export_timer.daemon = True
+            self._export_timer.start()
+
+    def flush(self, export_json=False):
+        """Hand the playlist and redownload queue to the file writer if they have changed.
+        
+        With msgpack installed the playlist goes to playlist.msgpack and
+        playlist.json is only rewritten when export_json is set.
+        """
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if export_json and self._export_timer is not None:
+                self._export_timer.cancel()
+                self._export_timer = None
+            # Serialize under the lock; the disk write happens on the writer thread
+            if self._dirty_playlist or (export_json and self._json_stale):
+                try:
+                    writer = get_file_writer()
+                    if MSGPACK_AVAILABLE:
+                        store_data = msgpack.packb(self.videos, use_bin_type=True)
+                        if export_json:
+                            # Both files get the same mtime, which _load_playlist() reads as in sync
+                            stamp = time.time()
+                            writer.submit(self.playlist_file, dump_json_bytes(self.videos), stamp)
+                            writer.submit(self.playlist_store, store_data, stamp)
+                            self._json_stale = False
+                        else:
+                            writer.submit(self.playlist_store, store_data)
+                            self._json_stale = True
+                            self._schedule_export()
+                    else:
+                        # playlist.json is edited and diffed by hand, so it stays indented
+                        writer.submit(self.playlist_file, dump_json_bytes(self.videos))
+                    self._dirty_playlist = False
+                except Exception as e:
+                    if DEBUG_MODE:
+                        print(f"Error saving playlist: {e}")
+            if self._dirty_queue:
+                try:
+                    get_file_writer().submit(self.redownload_file, dump_json_bytes(self.redownload_queue))
+                    self._dirty_queue = False
+                except Exception as e:
+                    if DEBUG_MODE:
+                        print(f"Error saving redownload queue: {e}")
+
+    def export_playlist_json(self):
+        """Write an up-to-date, indented playlist.json alongside the binary store."""
+        self.flush(export_json=True)
+
+    def close(self):
+        """Flush pending changes, export playlist.json and wait for them to reach disk."""
+        self.flush(export_json=True)
+        get_file_writer().wait()
+
     def get_sorted_videos(self):
-        try:
-            return sorted(
-                [{'url': url, **data} for url, data in self.videos.items()],
-                key=lambda x: x['title'].lower()
-            )
-        except Exception as e:
-            if DEBUG_MODE:
-                print(f"Error sorting videos: {e}")
-            return []
+        """Return the playlist sorted by title, re-sorted only after a change.
+        
+        The list is shared between callers and must not be modified.
+        """
+        with self._lock:
+            if self._sorted_videos_version == self.version:
+                return self._sorted_videos
+            try:
+                self._sorted_videos = sorted(
+                    [{'url': url, **data} for url, data in self.videos.items()],
+                    key=lambda x: x['title'].lower()
+                )
+            except Exception as e:
+                if DEBUG_MODE:
+                    print(f"Error sorting videos: {e}")
+                return []
+            self._sorted_videos_version = self.version
+            return self._sorted_videos
+
+    def get_sorted_videos_json(self):
+        """Return get_sorted_videos() as compact JSON bytes, rebuilt only after a change."""
+        with self._lock:
+            if self._playlist_json_version != self.version:
+                self._playlist_json = dump_json_bytes(self.get_sorted_videos(), compact=True)
+                self._playlist_json_version = self.version
+            return self._playlist_json
+
+    def wait_for_change(self, version, timeout=None):
+        """Block until the playlist version differs from version.
+        
+        Returns (new version, playlist JSON bytes), or None if timeout expired first.
+        """
+        with self._changed:
+            if not self._changed.wait_for(lambda: self.version != version, timeout):
+                return None
+            return self.version, self.get_sorted_videos_json()
+
+    def get_playlist_snapshot(self, gzipped=False):
+        """Return (version, playlist JSON bytes) taken together, gzip-compressed if asked."""
+        with self._lock:
+            body = self.get_sorted_videos_gzip() if gzipped else self.get_sorted_videos_json()
+            return self.version, body
+
+    def get_sorted_videos_gzip(self):
+        """Return get_sorted_videos_json() gzip-compressed, recompressed only after a change."""
+        with self._lock:
+            if self._playlist_gzip_version != self.version:
+                self._playlist_gzip = gzip.compress(self.get_sorted_videos_json(), 6)
+                self._playlist_gzip_version = self.version
+            return self._playlist_gzip
 
 class WebpageManager:
     def __init__(self, cache_dir):
+        self._lock = threading.Lock()
         try:
             self.cache_dir = cache_dir
             self.webpages_dir = cache_dir / "webpages"
@@ -1086,8 +1632,7 @@ class WebpageManager:
 
             # Load existing webpages or create empty dict
             if self.playlist_file.exists():
-                with open(self.playlist_file, 'r', encoding='utf-8') as f:
-                    self.webpages = json.load(f)
+                self.webpages = read_json_file(self.playlist_file)
             else:
                 self.webpages = {}
         except Exception as e:
@@ -1103,16 +1648,15 @@ class WebpageManager:
                 if domain.startswith('www.'):
                     domain = domain[4:]
 
-            self.webpages[url] = {
-                'title': title,
-                'filename': filename,
-                'domain': domain,
-                'filesize': filesize or 0,
-                'saved_date': datetime.datetime.now().isoformat()
-            }
-
-            with open(self.playlist_file, 'w', encoding='utf-8') as f:
-                json.dump(self.webpages, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                self.webpages[url] = {
+                    'title': title,
+                    'filename': filename,
+                    'domain': domain,
+                    'filesize': filesize or 0,
+                    'saved_date': datetime.datetime.now().isoformat()
+                }
+                self._save()
         except Exception as e:
             if DEBUG_MODE:
                 print(f"Error adding webpage to playlist: {e}")
@@ -1120,12 +1664,12 @@ class WebpageManager:
     def remove_webpage(self, url, logger=None):
         """Remove a webpage from the playlist and try to delete the file."""
         try:
-            if url in self.webpages:
-                filename = self.webpages[url]['filename']
-                # Remove from playlist first
-                del self.webpages[url]
-                with open(self.playlist_file, 'w', encoding='utf-8') as f:
-                    json.dump(self.webpages, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                entry = self.webpages.pop(url, None)
+                if entry is not None:
+                    self._save()
+            if entry is not None:
+                filename = entry['filename']
 
                 # Try to delete the file
                 file_path = self.webpages_dir / filename
@@ -1145,12 +1689,15 @@ class WebpageManager:
                 safe_log(logger, 'error', f"Error removing webpage: {e}")
             return False
 
+    def _save(self):
+        """Snapshot the playlist and hand the write to the background file writer (caller holds _lock)."""
+        get_file_writer().submit(self.playlist_file, dump_json_bytes(self.webpages))
+
     def get_sorted_webpages(self):
         try:
-            return sorted(
-                [{'url': url, **data} for url, data in self.webpages.items()],
-                key=lambda x: x['title'].lower()
-            )
+            with self._lock:
+                webpages = [{'url': url, **data} for url, data in self.webpages.items()]
+            return sorted(webpages, key=lambda x: x['title'].lower())
         except Exception as e:
             if DEBUG_MODE:
                 print(f"Error sorting webpages: {e}")
@@ -1226,13 +1773,234 @@ def download_webpage(url, cache_dir, webpage_manager, logger=None):
         if logger: safe_log(logger, 'error', f"Error downloading webpage: {str(e)}")
         return None, False
 
+# archive.org file categorisation: format/extension -> (extension label, priority),
+# lower priority is preferred
+_ARCHIVE_FORMAT_CATEGORIES = {
+    'mp4': ('mp4', 1), 'mpeg4': ('mp4', 1),
+    'webm': ('webm', 2),
+    'avi': ('avi', 3),
+    'mkv': ('mkv', 4), 'mov': ('mov', 4), 'flv': ('flv', 4),
+}
+_ARCHIVE_EXTENSION_CATEGORIES = {
+    '.mp4': ('mp4', 1),
+    '.webm': ('webm', 2),
+    '.avi': ('avi', 3),
+    '.mkv': ('mkv', 4), '.mov': ('mov', 4), '.flv': ('flv', 4),
+}
+_ARCHIVE_SKIP_RE = re.compile(r'thumb|screenshot|\.png|\.jpg|\.gif')
+_ARCHIVE_HQ_RE = re.compile(r'hd|720|1080|high')
+
+# Shared HTTP session so back-to-back requests to the same host (e.g. archive.org
+# metadata, file list and download) reuse kept-alive connections
+BROWSER_USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+
+def create_http_session():
+    """Create a pooled requests session with the browser User-Agent."""
+    session = requests.Session()
+    session.headers.update({"User-Agent": BROWSER_USER_AGENT})
+    # Retry transient failures; leave final status handling to the callers
+    retries = requests.adapters.Retry(total=3, backoff_factor=0.3,
+                                      status_forcelist=(429, 500, 502, 503, 504),
+                                      raise_on_status=False)
+    adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+_HTTP_SESSION = create_http_session()
+atexit.register(_HTTP_SESSION.close)
+
+# Small pool for issuing independent HTTP requests concurrently
+_HTTP_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix='mucache-http')
+
+@contextlib.contextmanager
+def report_download_progress(f, total_size, logger, interval=DOWNLOAD_PROGRESS_INTERVAL):
+    """Log how much of total_size has been written to f every interval seconds."""
+    if not (logger and DEBUG_MODE and total_size):
+        yield
+        return
+    stop = threading.Event()
+
+    def report():
+        while not stop.wait(interval):
+            try:
+                position = f.tell()
+            except (ValueError, OSError):
+                return
+            safe_log(logger, 'info', f"Download progress: {position / total_size * 100:.1f}%")
+
+    reporter = threading.Thread(target=report, name='mucache-progress', daemon=True)
+    reporter.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        reporter.join()
+
+def downloaded_file_name(ydl, info):
+    """Return the name of the file yt-dlp wrote for info, or None if it is not on disk.
+    
+    requested_downloads carries the final path after post-processors such as
+    the MP4 convertor have run; older yt-dlp releases only set filepath.
+    """
+    if info and 'requested_downloads' not in info and info.get('entries'):
+        # Playlist-style results: the first entry is the video that was fetched
+        info = next((entry for entry in info['entries'] if entry), None)
+    if not info:
+        return None
+    candidates = [download.get('filepath') for download in info.get('requested_downloads') or ()]
+    candidates.append(info.get('filepath'))
+    candidates.append(ydl.prepare_filename(info))
+    for candidate in candidates:
+        if candidate and os.path.isfile(candidate):
+            return os.path.basename(candidate)
+    return None
+
+def run_ytdlp_download(ytdl_options, url):
+    """Download url with yt-dlp and return the downloaded file's name, or None.
+    
+    The name comes from yt-dlp itself rather than from diffing the cache
+    directory, so concurrent downloads cannot pick up each other's files.
+    """
+    with yt_dlp.YoutubeDL(ytdl_options) as ydl:
+        info = ydl.extract_info(url, download=True)
+        return downloaded_file_name(ydl, info)
+
+# Parallel Range download settings for large direct file downloads
+RANGE_DOWNLOAD_WORKERS = 8
+RANGE_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+def probe_range_support(url, session=None, timeout=30):
+    """Return (final_url, size) if the server supports byte ranges, otherwise None."""
+    session = session or _HTTP_SESSION
+    response = session.head(url, allow_redirects=True, timeout=timeout)
+    try:
+        if response.status_code != 200:
+            return None
+        if response.headers.get('accept-ranges', '').lower() != 'bytes':
+            return None
+        size = int(response.headers.get('content-length', 0))
+        if size <= 0:
+            return None
+        return getattr(response, 'url', None) or url, size
+    finally:
+        response.close()
+
+def download_ranges(url, size, path, workers=RANGE_DOWNLOAD_WORKERS, chunk=RANGE_DOWNLOAD_CHUNK_SIZE,
+                    session=None, logger=None):
+    """Download url into path with parallel Range requests. Returns False if any part fails."""
+    session = session or _HTTP_SESSION
+    ranges = [(lo, min(lo + chunk, size) - 1) for lo in range(0, size, chunk)]
+    failed = threading.Event()
+
+    fd = os.open(str(path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0))
+    try:
+        os.ftruncate(fd, size)
+
+        def fetch(lo, hi):
+            if failed.is_set():
+                return
+            response = session.get(url, headers={'Range': f'bytes={lo}-{hi}'}, stream=True, timeout=60)
+            try:
+                if response.status_code != 206:
+                    raise IOError(f"Server replied {response.status_code} to a range request")
+                offset = lo
+                if hasattr(os, 'pwrite'):
+                    for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        if failed.is_set():
+                            return
+                        while block:
+                            written = os.pwrite(fd, block, offset)
+                            offset += written
+                            block = block[written:]
+                else:
+                    # No positioned writes (Windows): each worker seeks its own handle
+                    with open(path, 'r+b') as f:
+                        f.seek(lo)
+                        for block in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            if failed.is_set():
+                                return
+                            f.write(block)
+                            offset += len(block)
+                if offset != hi + 1:
+                    raise IOError(f"Range {lo}-{hi} ended early at byte {offset}")
+                return hi - lo + 1
+            finally:
+                response.close()
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers, thread_name_prefix='mucache-range') as pool:
+            futures = [pool.submit(fetch, lo, hi) for lo, hi in ranges]
+            # Log progress every 10MB for files >50MB
+            done_bytes = 0
+            next_log = 10*1024*1024 if size > 50*1024*1024 else float('inf')
+            for future in concurrent.futures.as_completed(futures):
+                if future.cancelled():
+                    continue
+                error = future.exception()
+                if error is not None:
+                    if not failed.is_set():
+                        failed.set()
+                        for other in futures:
+                            other.cancel()
+                        if logger and DEBUG_MODE:
+                            safe_log(logger, 'warning', f"Parallel download failed: {str(error)}")
+                    continue
+                done_bytes += future.result() or 0
+                if done_bytes >= next_log:
+                    if logger and DEBUG_MODE:
+                        safe_log(logger, 'info', f"Download progress: {done_bytes / size * 100:.1f}%")
+                    while next_log <= done_bytes:
+                        next_log += 10*1024*1024
+    finally:
+        os.close(fd)
+
+    return not failed.is_set()
+
+# URL/page patterns used by the platform-specific downloaders
+_TWEET_ID_RE = re.compile(r'status/(\d+)')
+# One alternation for all Twitter video URL shapes, most specific first, so
+# the page is scanned once; the group name records which shape matched
+_TWITTER_VIDEO_RE = re.compile(
+    r'(?P<amplify>https://video\.twimg\.com/amplify_video/\d+/vid/[^"\'&?]+\.mp4[^"\'\s]*)'
+    r'|(?P<ext_tw>https://video\.twimg\.com/ext_tw_video/\d+/[^"\'&?]+\.mp4[^"\'\s]*)'
+    r'|(?P<tweet>https://video\.twimg\.com/tweet_video/[^"\'&?]+\.mp4[^"\'\s]*)'
+    r'|(?P<generic>https://video\.twimg\.com/[^"\'&?]+\.mp4[^"\'\s]*)'
+)
+_TWITTER_VIDEO_PREFERENCE = ('amplify', 'ext_tw', 'tweet')
+_ARCHIVE_ITEM_RE = re.compile(r'archive\.org/(?:details|embed)/([^/?]+)')
+_YT_ID_IN_ARCHIVE_RE = re.compile(r'--([a-zA-Z0-9_-]{11})$')
+_REDDIT_POST_ID_RE = re.compile(r'/comments/([a-zA-Z0-9]+)/')
+
+def find_twitter_video_urls(html):
+    """Return candidate video URLs from a tweet page in preference order."""
+    # A plain substring search rejects pages without any twimg video link
+    # faster than running the alternation across the whole document
+    if 'video.twimg.com/' not in html:
+        return []
+    first_by_kind = {}
+    first_any = None
+    for match in _TWITTER_VIDEO_RE.finditer(html):
+        if first_any is None:
+            first_any = match.group(0)
+        first_by_kind.setdefault(match.lastgroup, match.group(0))
+    
+    candidates = []
+    for kind in _TWITTER_VIDEO_PREFERENCE:
+        video_url = first_by_kind.get(kind)
+        if video_url and video_url not in candidates:
+            candidates.append(video_url)
+    # Any twimg .mp4 link is the last resort
+    if first_any and first_any not in candidates:
+        candidates.append(first_any)
+    return candidates
+
 def download_twitter_video(url, cache_dir, manager, logger=None):
     """Download Twitter/X videos."""
     try:
         if logger: safe_log(logger, 'info', f"Starting Twitter/X video download: {url}")
         
         # Extract tweet ID
-        match = re.search(r'status/(\d+)', url)
+        match = _TWEET_ID_RE.search(url)
         if not match:
             if logger: safe_log(logger, 'error', f"Could not extract tweet ID from URL: {url}")
             return None, False
@@ -1244,39 +2012,31 @@ def download_twitter_video(url, cache_dir, manager, logger=None):
         
         # Normalize URL
         twitter_url = url.replace("x.com", "twitter.com") if "x.com" in url else url
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
         
         # Get the tweet page
-        response = requests.get(twitter_url, headers=headers, timeout=30)
+        response = _HTTP_SESSION.get(twitter_url, timeout=30)
         
         if response.status_code == 200:
             html = response.text
             
             # Look for video URLs
-            video_patterns = [
-                r'(https://video\.twimg\.com/amplify_video/\d+/vid/[^"\'&?]+\.mp4[^"\'\s]*)',
-                r'(https://video\.twimg\.com/ext_tw_video/\d+/[^"\'&?]+\.mp4[^"\'\s]*)',
-                r'(https://video\.twimg\.com/tweet_video/[^"\'&?]+\.mp4[^"\'\s]*)',
-                r'(https://video\.twimg\.com/[^"\'&?]+\.mp4[^"\'\s]*)'
-            ]
-            
-            for pattern in video_patterns:
-                matches = re.findall(pattern, html)
-                if matches:
-                    video_url = matches[0]
-                    if logger and DEBUG_MODE: 
-                        safe_log(logger, 'info', f"Found video URL: {video_url}")
-                    
-                    video_response = requests.get(video_url, stream=True, timeout=60)
-                    if video_response.status_code == 200:
-                        with open(file_path, 'wb') as f:
-                            for chunk in video_response.iter_content(chunk_size=8192):
-                                f.write(chunk)
-                        
-                        if file_path.exists() and file_path.stat().st_size > 10000:
-                            manager.add_video(url, safe_title, safe_filename)
-                            if logger: safe_log(logger, 'info', f"Twitter video downloaded successfully: {safe_filename}")
-                            return safe_filename, False
+            for video_url in find_twitter_video_urls(html):
+                if logger and DEBUG_MODE: 
+                    safe_log(logger, 'info', f"Found video URL: {video_url}")
+                
+                # Closing the streamed response hands its connection back to the pool
+                with _HTTP_SESSION.get(video_url, stream=True, timeout=60) as video_response:
+                    if video_response.status_code != 200:
+                        continue
+                    # Copy the raw stream in C with 1MB buffers instead of 8KB Python-level writes
+                    video_response.raw.decode_content = True
+                    with open(file_path, 'wb') as f:
+                        shutil.copyfileobj(video_response.raw, f, DOWNLOAD_CHUNK_SIZE)
+                
+                if file_path.exists() and file_path.stat().st_size > 10000:
+                    manager.add_video(url, safe_title, safe_filename)
+                    if logger: safe_log(logger, 'info', f"Twitter video downloaded successfully: {safe_filename}")
+                    return safe_filename, False
         
         if logger: safe_log(logger, 'error', "Twitter video download failed")
         return None, False
@@ -1296,7 +2056,7 @@ def download_archive_video(url, cache_dir, manager, logger=None):
         # https://archive.org/embed/VideoName
         # Extract the item identifier
         
-        item_match = re.search(r'archive\.org/(?:details|embed)/([^/?]+)', url)
+        item_match = _ARCHIVE_ITEM_RE.search(url)
         if not item_match:
             if logger: safe_log(logger, 'error', f"Could not extract item ID from archive.org URL: {url}")
             return None, False
@@ -1305,14 +2065,19 @@ def download_archive_video(url, cache_dir, manager, logger=None):
         
         # Get comprehensive metadata from archive.org API
         metadata_url = f"https://archive.org/metadata/{item_id}"
-        headers = {"User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"}
+        files_url = f"https://archive.org/metadata/{item_id}/files"
+        
+        # The metadata and file list requests are independent, so issue both at once
+        metadata_future = _HTTP_EXECUTOR.submit(_HTTP_SESSION.get, metadata_url, timeout=15)
+        files_future = _HTTP_EXECUTOR.submit(_HTTP_SESSION.get, files_url, timeout=15)
         
         enhanced_metadata = {}
         
         try:
-            metadata_response = requests.get(metadata_url, headers=headers, timeout=15)
+            metadata_response = metadata_future.result()
             if metadata_response.status_code != 200:
                 if logger: safe_log(logger, 'error', f"Failed to get metadata for {item_id}")
+                files_future.cancel()
                 return None, False
                 
             metadata = metadata_response.json()
@@ -1346,7 +2111,7 @@ def download_archive_video(url, cache_dir, manager, logger=None):
             if 'youtube' in item_id.lower() or 'yt' in item_id.lower():
                 enhanced_metadata['original_platform'] = 'YouTube (archived)'
                 # Try to extract original YouTube ID if present
-                yt_id_match = re.search(r'--([a-zA-Z0-9_-]{11})$', item_id)
+                yt_id_match = _YT_ID_IN_ARCHIVE_RE.search(item_id)
                 if yt_id_match:
                     enhanced_metadata['original_youtube_id'] = yt_id_match.group(1)
                     enhanced_metadata['original_youtube_url'] = f"https://www.youtube.com/watch?v={yt_id_match.group(1)}"
@@ -1365,10 +2130,8 @@ def download_archive_video(url, cache_dir, manager, logger=None):
             enhanced_metadata = {'title': safe_title, 'identifier': item_id}
         
         # Try to find video files in the item
-        files_url = f"https://archive.org/metadata/{item_id}/files"
-        
         try:
-            files_response = requests.get(files_url, headers=headers, timeout=15)
+            files_response = files_future.result()
             if files_response.status_code == 200:
                 files_data = files_response.json()
                 
@@ -1397,7 +2160,9 @@ def download_archive_video(url, cache_dir, manager, logger=None):
                     safe_log(logger, 'info', f"Found {len(files_list)} files in archive")
                 
                 # Look for video files with enhanced filtering
-                video_files = []
+                # Best candidate so far, ordered by priority (lower is better) then size (larger is better)
+                best_file = None
+                best_key = None
                 for file_info in files_list:
                     # Skip if file_info is not a dictionary
                     if not isinstance(file_info, dict):
@@ -1406,37 +2171,46 @@ def download_archive_video(url, cache_dir, manager, logger=None):
                         continue
                     
                     filename = file_info.get('name', '')
+                    filename_lower = filename.lower()
                     format_type = file_info.get('format', '').lower()
                     size = file_info.get('size', 0)
                     
-                    # Skip thumbnail and very small files
-                    if any(skip_word in filename.lower() for skip_word in ['thumb', 'screenshot', '.png', '.jpg', '.gif']):
-                        continue
-                    
                     # Convert size to int safely
-                    try:
-                        size_int = int(size) if size else 0
-                    except (ValueError, TypeError):
-                        size_int = 0
+                    if isinstance(size, int):
+                        size_int = size
+                    else:
+                        try:
+                            size_int = int(size or 0)
+                        except (ValueError, TypeError):
+                            size_int = 0
                     
                     if size_int < 1000000:  # Skip files smaller than 1MB
                         continue
                     
-                    # Categorize video files by quality/preference
-                    if format_type in ['mp4', 'mpeg4'] or filename.lower().endswith('.mp4'):
+                    # Skip thumbnails and images
+                    if _ARCHIVE_SKIP_RE.search(filename_lower):
+                        continue
+                    
+                    # Categorize video files by quality/preference; the better of the
+                    # format-based and extension-based categories wins
+                    category = _ARCHIVE_FORMAT_CATEGORIES.get(format_type)
+                    ext_category = _ARCHIVE_EXTENSION_CATEGORIES.get(os.path.splitext(filename_lower)[1])
+                    if ext_category and (category is None or ext_category[1] < category[1]):
+                        category = ext_category
+                    if category is None:
+                        continue
+                    
+                    video_ext, priority = category
+                    if video_ext == 'mp4':
                         # Prefer HD/high quality versions
-                        priority = 1
-                        if any(quality in filename.lower() for quality in ['hd', '720', '1080', 'high']):
+                        if _ARCHIVE_HQ_RE.search(filename_lower):
                             priority = 0
-                        video_files.append((filename, 'mp4', size_int, priority, file_info))
-                    elif format_type in ['webm'] or filename.lower().endswith('.webm'):
-                        video_files.append((filename, 'webm', size_int, 2, file_info))
-                    elif format_type in ['avi'] or filename.lower().endswith('.avi'):
-                        video_files.append((filename, 'avi', size_int, 3, file_info))
-                    elif format_type in ['mkv', 'mov', 'flv'] or any(filename.lower().endswith(ext) for ext in ['.mkv', '.mov', '.flv']):
-                        video_files.append((filename, format_type, size_int, 4, file_info))
+                    key = (priority, -size_int)
+                    if best_key is None or key < best_key:
+                        best_key = key
+                        best_file = (filename, video_ext, size_int, file_info)
                 
-                if not video_files:
+                if best_file is None:
                     if logger: safe_log(logger, 'error', f"No suitable video files found for {item_id}")
                     
                     # Debug: Log what files were found
@@ -1453,14 +2227,7 @@ def download_archive_video(url, cache_dir, manager, logger=None):
                     
                     return None, False
                 
-                # Sort by priority (lower is better), then by size (larger is better)
-                video_files.sort(key=lambda x: (x[3], -x[2]))
-                best_file = video_files[0]
-                
-                video_filename = best_file[0]
-                video_ext = best_file[1]
-                video_size = best_file[2]
-                file_metadata = best_file[4]
+                video_filename, video_ext, video_size, file_metadata = best_file
                 
                 if logger and DEBUG_MODE: 
                     safe_log(logger, 'info', f"Selected video file: {video_filename} ({video_ext}, {video_size} bytes)")
@@ -1481,17 +2248,15 @@ def download_archive_video(url, cache_dir, manager, logger=None):
                 else:
                     safe_filename = f"{safe_title}.{video_ext}"
                 
-                # Apply sanitization twice to ensure Windows compatibility
+                # Sanitize for Windows compatibility (this also replaces '/' and '\\')
                 safe_filename = sanitize_filename(safe_filename)
                 
-                # Additional cleanup for problematic characters
-                safe_filename = safe_filename.replace('/', ' ').replace('\\', ' ')
-                
                 # Ensure filename isn't too long (Windows 260 char limit)
                 if len(safe_filename) > 200:
-                    name_part = safe_filename.rsplit('.', 1)[0][:190]
-                    ext_part = safe_filename.rsplit('.', 1)[1] if '.' in safe_filename else video_ext
-                    safe_filename = f"{name_part}.{ext_part}"
+                    name_part, dot, ext_part = safe_filename.rpartition('.')
+                    if not dot:
+                        name_part, ext_part = safe_filename, video_ext
+                    safe_filename = f"{name_part[:190]}.{ext_part}"
                 
                 file_path = cache_dir / safe_filename
                 
@@ -1501,45 +2266,63 @@ def download_archive_video(url, cache_dir, manager, logger=None):
                     safe_log(logger, 'info', f"Downloading: {download_url}")
                     safe_log(logger, 'info', f"File size: {video_size} bytes")
                 
-                video_response = requests.get(download_url, stream=True, headers=headers, timeout=60)
-                if video_response.status_code == 200:
-                    total_size = int(video_response.headers.get('content-length', 0))
-                    downloaded = 0
-                    
-                    with open(file_path, 'wb') as f:
-                        for chunk in video_response.iter_content(chunk_size=1024*1024):  # 1MB chunks
-                            if chunk:
-                                f.write(chunk)
-                                downloaded += len(chunk)
-                                
-                                # Log progress for large files
-                                if total_size > 50*1024*1024 and downloaded % (10*1024*1024) == 0:  # Every 10MB for files >50MB
-                                    progress = (downloaded / total_size) * 100 if total_size else 0
-                                    if logger and DEBUG_MODE: 
-                                        safe_log(logger, 'info', f"Download progress: {progress:.1f}%")
-                    
-                    if file_path.exists() and file_path.stat().st_size > 10000:
-                        # Store the enhanced metadata with the video entry
-                        manager.add_video(url, safe_title, safe_filename)
-                        
-                        # Save additional metadata to a separate file
-                        metadata_file = cache_dir / f"{safe_filename}.metadata.json"
+                # Download under a .part name and only move it into place once complete,
+                # so a failed (possibly preallocated) download never lands in the cache
+                part_path = file_path.with_name(file_path.name + '.part')
+                downloaded = False
+                try:
+                    # Large files are fetched in parallel byte ranges when the mirror allows it
+                    ranged = False
+                    if video_size > RANGE_DOWNLOAD_CHUNK_SIZE:
                         try:
-                            with open(metadata_file, 'w', encoding='utf-8') as f:
-                                json.dump(enhanced_metadata, f, indent=2, ensure_ascii=False)
-                            if logger and DEBUG_MODE: 
-                                safe_log(logger, 'info', f"Metadata saved to: {metadata_file.name}")
+                            probe = probe_range_support(download_url)
+                            if probe:
+                                ranged = download_ranges(probe[0], probe[1], part_path, logger=logger)
                         except Exception as e:
-                            if logger and DEBUG_MODE: 
-                                safe_log(logger, 'warning', f"Could not save metadata file: {str(e)}")
-                        
-                        if logger: safe_log(logger, 'info', f"Successfully downloaded archive.org video: {safe_filename}")
-                        return safe_filename, False
-                    else:
-                        if logger: safe_log(logger, 'error', f"Downloaded file is too small or doesn't exist")
-                        return None, False
+                            if logger and DEBUG_MODE:
+                                safe_log(logger, 'warning', f"Range download unavailable, streaming instead: {str(e)}")
+                    
+                    if not ranged:
+                        with _HTTP_SESSION.get(download_url, stream=True, timeout=60) as video_response:
+                            if video_response.status_code != 200:
+                                if logger: safe_log(logger, 'error', f"Failed to download video file: {video_response.status_code}")
+                                return None, False
+                            
+                            total_size = int(video_response.headers.get('content-length', 0))
+                            
+                            with open(part_path, 'wb') as f:
+                                # Log progress for files >50MB from a sampler thread rather than per chunk
+                                with report_download_progress(f, total_size if total_size > 50*1024*1024 else 0, logger):
+                                    video_response.raw.decode_content = True
+                                    shutil.copyfileobj(video_response.raw, f, DOWNLOAD_COPY_SIZE)
+                    
+                    if part_path.stat().st_size > 10000:
+                        os.replace(str(part_path), str(file_path))
+                        downloaded = True
+                finally:
+                    try:
+                        part_path.unlink()
+                    except OSError:
+                        pass
+                
+                if downloaded:
+                    # Store the enhanced metadata with the video entry
+                    manager.add_video(url, safe_title, safe_filename)
+                    
+                    # Save additional metadata to a separate file
+                    metadata_file = cache_dir / f"{safe_filename}.metadata.json"
+                    try:
+                        write_json_file(metadata_file, enhanced_metadata)
+                        if logger and DEBUG_MODE: 
+                            safe_log(logger, 'info', f"Metadata saved to: {metadata_file.name}")
+                    except Exception as e:
+                        if logger and DEBUG_MODE: 
+                            safe_log(logger, 'warning', f"Could not save metadata file: {str(e)}")
+                    
+                    if logger: safe_log(logger, 'info', f"Successfully downloaded archive.org video: {safe_filename}")
+                    return safe_filename, False
                 else:
-                    if logger: safe_log(logger, 'error', f"Failed to download video file: {video_response.status_code}")
+                    if logger: safe_log(logger, 'error', f"Downloaded file is too small or doesn't exist")
                     return None, False
                     
         except Exception as e:
@@ -1566,130 +2349,91 @@ def download_reddit_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=No
         elif "reddit.com" in url and not url.startswith("http"):
             url = f"https://{url}"
 
-        current_dir = os.getcwd()
+        # Get video info first
         try:
-            os.chdir(str(cache_dir))
-
-            # Track files before download
-            before_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
+            info = extract_video_info(url)
+            title = info.get('title', 'Reddit Video')
 
-            # Get video info first
-            try:
-                with yt_dlp.YoutubeDL({
-                    'skip_download': True,
-                    'quiet': True,
-                    'no_warnings': True
-                }) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'Reddit Video')
-
-                    # Extract Reddit post ID for consistent naming
-                    post_id = None
-                    if 'id' in info:
-                        post_id = info['id']
-                    else:
-                        # Try to extract from URL
-                        import re
-                        match = re.search(r'/comments/([a-zA-Z0-9]+)/', url)
-                        if match:
-                            post_id = match.group(1)
-
-                    if post_id:
-                        safe_title = f"Reddit_{post_id}_{sanitize_filename(title)}"
-                    else:
-                        safe_title = f"Reddit_{sanitize_filename(title)}"
-
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', f"Reddit video title: {title}")
-                    if post_id:
-                        safe_log(logger, 'info', f"Reddit post ID: {post_id}")
+            # Extract Reddit post ID for consistent naming
+            post_id = None
+            if 'id' in info:
+                post_id = info['id']
+            else:
+                # Try to extract from URL
+                match = _REDDIT_POST_ID_RE.search(url)
+                if match:
+                    post_id = match.group(1)
 
-            except Exception as e:
-                if logger: safe_log(logger, 'warning', f"Error getting Reddit video info: {e}")
-                safe_title = "Reddit_Video"
-
-            # Configure yt-dlp options for Reddit
-            ytdl_options = {
-                'format': 'best[ext=mp4]/best',
-                'outtmpl': f'{safe_title}.%(ext)s',
-                'quiet': True,
-                'no_warnings': True,
-                'writeinfojson': False,
-                'writedescription': False,
-                'writesubtitles': False,
-                'writeautomaticsub': False,
-            }
+            if post_id:
+                safe_title = f"Reddit_{post_id}_{sanitize_filename(title)}"
+            else:
+                safe_title = f"Reddit_{sanitize_filename(title)}"
 
-            # Apply FFmpeg plugin options if available for better quality
-            if ffmpeg_plugin and ffmpeg_plugin.available:
-                ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "Using FFmpeg for Reddit video processing")
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', f"Reddit video title: {title}")
+                if post_id:
+                    safe_log(logger, 'info', f"Reddit post ID: {post_id}")
 
-            # Download the video
-            try:
-                with yt_dlp.YoutubeDL(ytdl_options) as ydl:
-                    ydl.download([url])
+        except Exception as e:
+            if logger: safe_log(logger, 'warning', f"Error getting Reddit video info: {e}")
+            safe_title = "Reddit_Video"
 
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "Reddit video download completed")
+        # Configure yt-dlp options for Reddit
+        ytdl_options = {
+            'format': 'best[ext=mp4]/best',
+            'outtmpl': f'{safe_title}.%(ext)s',
+            'paths': {'home': str(cache_dir)},
+            'quiet': True,
+            'no_warnings': True,
+            'writeinfojson': False,
+            'writedescription': False,
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+        }
 
-            except Exception as e:
-                if logger: safe_log(logger, 'error', f"Reddit video download failed: {str(e)}")
-                return None, False
+        # Apply FFmpeg plugin options if available for better quality
+        if ffmpeg_plugin and ffmpeg_plugin.available:
+            ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "Using FFmpeg for Reddit video processing")
 
-            # Find the downloaded file
-            after_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-            new_files = after_files - before_files
+        # Download the video
+        try:
+            new_filename = run_ytdlp_download(ytdl_options, url)
 
-            if new_files:
-                new_filename = list(new_files)[0]
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "Reddit video download completed")
 
-                # Sanitize filename if needed
-                has_special_chars = any(ord(c) >= 128 for c in new_filename)
-                if has_special_chars:
-                    safe_name = sanitize_filename(new_filename)
-                    if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
-                        ext = new_filename.split(".")[-1]
-                        safe_name = f"{safe_name}.{ext}"
+        except Exception as e:
+            if logger: safe_log(logger, 'error', f"Reddit video download failed: {str(e)}")
+            return None, False
 
-                    new_path = cache_dir / new_filename
-                    safe_path = cache_dir / safe_name
+        if new_filename:
+            # Sanitize filename if needed
+            has_special_chars = not is_ascii(new_filename)
+            if has_special_chars:
+                safe_name = sanitize_filename(new_filename)
+                if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
+                    ext = new_filename.split(".")[-1]
+                    safe_name = f"{safe_name}.{ext}"
 
-                    try:
-                        new_path.rename(safe_path)
-                        new_filename = safe_name
-                        if logger and DEBUG_MODE:
-                            safe_log(logger, 'info', f"Renamed Reddit file to: {safe_name}")
-                    except Exception as e:
-                        if logger: safe_log(logger, 'error', f"Error renaming Reddit file: {str(e)}")
+                new_path = cache_dir / new_filename
+                safe_path = cache_dir / safe_name
 
-                # Add to video manager with Reddit platform identifier
-                manager.add_video(url, title, new_filename)
-                if logger: safe_log(logger, 'info', f"Successfully downloaded Reddit video: {new_filename}")
-                return new_filename, False
-            else:
-                # Fallback: look for recent files
-                recent_time = datetime.datetime.now() - datetime.timedelta(minutes=2)
-                recent_files = [f for f in cache_dir.iterdir()
-                               if f.is_file() and f.stat().st_mtime > recent_time.timestamp()]
-
-                if recent_files:
-                    recent_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                    newest_file = recent_files[0]
-                    manager.add_video(url, title, newest_file.name)
+                try:
+                    new_path.rename(safe_path)
+                    new_filename = safe_name
                     if logger and DEBUG_MODE:
-                        safe_log(logger, 'info', f"Using recent Reddit file: {newest_file.name}")
-                    return newest_file.name, False
+                        safe_log(logger, 'info', f"Renamed Reddit file to: {safe_name}")
+                except Exception as e:
+                    if logger: safe_log(logger, 'error', f"Error renaming Reddit file: {str(e)}")
 
-        finally:
-            try:
-                os.chdir(current_dir)
-            except Exception as e:
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'warning', f"Error changing back to original directory: {e}")
+            # Add to video manager with Reddit platform identifier
+            manager.add_video(url, title, new_filename)
+            if logger: safe_log(logger, 'info', f"Successfully downloaded Reddit video: {new_filename}")
+            return new_filename, False
 
-        if logger: safe_log(logger, 'error', "Reddit video download failed - no files found")
+        if logger: safe_log(logger, 'error', "Reddit video download failed - no file reported by yt-dlp")
         return None, False
 
     except Exception as e:
@@ -1701,116 +2445,78 @@ def download_cnn_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=None)
     try:
         if logger: safe_log(logger, 'info', f"Starting CNN video download: {url}")
 
-        current_dir = os.getcwd()
+        # Get video info first
         try:
-            os.chdir(str(cache_dir))
-
-            # Track files before download
-            before_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
+            info = extract_video_info(url)
+            title = info.get('title', 'CNN Video')
 
-            # Get video info first
-            try:
-                with yt_dlp.YoutubeDL({
-                    'skip_download': True,
-                    'quiet': True,
-                    'no_warnings': True
-                }) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'CNN Video')
+            # Clean title for filename
+            safe_title = f"CNN_{sanitize_filename(title)}"
 
-                    # Clean title for filename
-                    safe_title = f"CNN_{sanitize_filename(title)}"
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', f"CNN video title: {title}")
 
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', f"CNN video title: {title}")
+        except Exception as e:
+            if logger: safe_log(logger, 'warning', f"Error getting CNN video info: {e}")
+            safe_title = "CNN_Video"
+            title = "CNN Video"
 
-            except Exception as e:
-                if logger: safe_log(logger, 'warning', f"Error getting CNN video info: {e}")
-                safe_title = "CNN_Video"
-                title = "CNN Video"
-
-            # Configure yt-dlp options for CNN
-            ytdl_options = {
-                'format': 'best[ext=mp4]/best',
-                'outtmpl': f'{safe_title}.%(ext)s',
-                'quiet': True,
-                'no_warnings': True,
-                'writeinfojson': False,
-                'writedescription': False,
-                'writesubtitles': False,
-                'writeautomaticsub': False,
-            }
+        # Configure yt-dlp options for CNN
+        ytdl_options = {
+            'format': 'best[ext=mp4]/best',
+            'outtmpl': f'{safe_title}.%(ext)s',
+            'paths': {'home': str(cache_dir)},
+            'quiet': True,
+            'no_warnings': True,
+            'writeinfojson': False,
+            'writedescription': False,
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+        }
 
-            # Apply FFmpeg plugin options if available for better quality
-            if ffmpeg_plugin and ffmpeg_plugin.available:
-                ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "Using FFmpeg for CNN video processing")
+        # Apply FFmpeg plugin options if available for better quality
+        if ffmpeg_plugin and ffmpeg_plugin.available:
+            ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "Using FFmpeg for CNN video processing")
 
-            # Download the video using yt-dlp (handles HLS/DASH extraction)
-            try:
-                with yt_dlp.YoutubeDL(ytdl_options) as ydl:
-                    ydl.download([url])
+        # Download the video using yt-dlp (handles HLS/DASH extraction)
+        try:
+            new_filename = run_ytdlp_download(ytdl_options, url)
 
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "CNN video download completed")
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "CNN video download completed")
 
-            except Exception as e:
-                if logger: safe_log(logger, 'error', f"CNN video download failed. Unable to extract video stream. CNN video may be unsupported: {str(e)}")
-                return None, False
-
-            # Find the downloaded file
-            after_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-            new_files = after_files - before_files
-
-            if new_files:
-                new_filename = list(new_files)[0]
-
-                # Sanitize filename if needed
-                has_special_chars = any(ord(c) >= 128 for c in new_filename)
-                if has_special_chars:
-                    safe_name = sanitize_filename(new_filename)
-                    if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
-                        ext = new_filename.split(".")[-1]
-                        safe_name = f"{safe_name}.{ext}"
+        except Exception as e:
+            if logger: safe_log(logger, 'error', f"CNN video download failed. Unable to extract video stream. CNN video may be unsupported: {str(e)}")
+            return None, False
 
-                    new_path = cache_dir / new_filename
-                    safe_path = cache_dir / safe_name
+        if new_filename:
+            # Sanitize filename if needed
+            has_special_chars = not is_ascii(new_filename)
+            if has_special_chars:
+                safe_name = sanitize_filename(new_filename)
+                if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
+                    ext = new_filename.split(".")[-1]
+                    safe_name = f"{safe_name}.{ext}"
 
-                    try:
-                        new_path.rename(safe_path)
-                        new_filename = safe_name
-                        if logger and DEBUG_MODE:
-                            safe_log(logger, 'info', f"Renamed CNN file to: {safe_name}")
-                    except Exception as e:
-                        if logger: safe_log(logger, 'error', f"Error renaming CNN file: {str(e)}")
+                new_path = cache_dir / new_filename
+                safe_path = cache_dir / safe_name
 
-                # Add to video manager with CNN platform identifier
-                manager.add_video(url, title, new_filename)
-                if logger: safe_log(logger, 'info', f"Successfully downloaded CNN video: {new_filename}")
-                return new_filename, False
-            else:
-                # Fallback: look for recent files
-                recent_time = datetime.datetime.now() - datetime.timedelta(minutes=2)
-                recent_files = [f for f in cache_dir.iterdir()
-                               if f.is_file() and f.stat().st_mtime > recent_time.timestamp()]
-
-                if recent_files:
-                    recent_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                    newest_file = recent_files[0]
-                    manager.add_video(url, title, newest_file.name)
+                try:
+                    new_path.rename(safe_path)
+                    new_filename = safe_name
                     if logger and DEBUG_MODE:
-                        safe_log(logger, 'info', f"Using recent CNN file: {newest_file.name}")
-                    return newest_file.name, False
+                        safe_log(logger, 'info', f"Renamed CNN file to: {safe_name}")
+                except Exception as e:
+                    if logger: safe_log(logger, 'error', f"Error renaming CNN file: {str(e)}")
 
-        finally:
-            try:
-                os.chdir(current_dir)
-            except Exception as e:
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'warning', f"Error changing back to original directory: {e}")
+            # Add to video manager with CNN platform identifier
+            manager.add_video(url, title, new_filename)
+            if logger: safe_log(logger, 'info', f"Successfully downloaded CNN video: {new_filename}")
+            return new_filename, False
 
-        if logger: safe_log(logger, 'error', "CNN video download failed - no files found")
+        if logger: safe_log(logger, 'error', "CNN video download failed - no file reported by yt-dlp")
         return None, False
 
     except Exception as e:
@@ -1822,116 +2528,78 @@ def download_cspan_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=Non
     try:
         if logger: safe_log(logger, 'info', f"Starting C-SPAN video download: {url}")
 
-        current_dir = os.getcwd()
+        # Get video info first
         try:
-            os.chdir(str(cache_dir))
-
-            # Track files before download
-            before_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-
-            # Get video info first
-            try:
-                with yt_dlp.YoutubeDL({
-                    'skip_download': True,
-                    'quiet': True,
-                    'no_warnings': True
-                }) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'C-SPAN Video')
-
-                    # Clean title for filename
-                    safe_title = f"CSPAN_{sanitize_filename(title)}"
-
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', f"C-SPAN video title: {title}")
+            info = extract_video_info(url)
+            title = info.get('title', 'C-SPAN Video')
 
-            except Exception as e:
-                if logger: safe_log(logger, 'warning', f"Error getting C-SPAN video info: {e}")
-                safe_title = "CSPAN_Video"
-                title = "C-SPAN Video"
-
-            # Configure yt-dlp options for C-SPAN
-            ytdl_options = {
-                'format': 'best[ext=mp4]/best',
-                'outtmpl': f'{safe_title}.%(ext)s',
-                'quiet': True,
-                'no_warnings': True,
-                'writeinfojson': False,
-                'writedescription': False,
-                'writesubtitles': False,
-                'writeautomaticsub': False,
-            }
+            # Clean title for filename
+            safe_title = f"CSPAN_{sanitize_filename(title)}"
 
-            # Apply FFmpeg plugin options if available for better quality
-            if ffmpeg_plugin and ffmpeg_plugin.available:
-                ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "Using FFmpeg for C-SPAN video processing")
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', f"C-SPAN video title: {title}")
 
-            # Download the video using yt-dlp (handles JWPlayer extraction)
-            try:
-                with yt_dlp.YoutubeDL(ytdl_options) as ydl:
-                    ydl.download([url])
+        except Exception as e:
+            if logger: safe_log(logger, 'warning', f"Error getting C-SPAN video info: {e}")
+            safe_title = "CSPAN_Video"
+            title = "C-SPAN Video"
 
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'info', "C-SPAN video download completed")
+        # Configure yt-dlp options for C-SPAN
+        ytdl_options = {
+            'format': 'best[ext=mp4]/best',
+            'outtmpl': f'{safe_title}.%(ext)s',
+            'paths': {'home': str(cache_dir)},
+            'quiet': True,
+            'no_warnings': True,
+            'writeinfojson': False,
+            'writedescription': False,
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+        }
 
-            except Exception as e:
-                if logger: safe_log(logger, 'error', f"C-SPAN video download failed. Unable to extract JWPlayer stream. C-SPAN video may be unsupported: {str(e)}")
-                return None, False
+        # Apply FFmpeg plugin options if available for better quality
+        if ffmpeg_plugin and ffmpeg_plugin.available:
+            ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "Using FFmpeg for C-SPAN video processing")
 
-            # Find the downloaded file
-            after_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-            new_files = after_files - before_files
+        # Download the video using yt-dlp (handles JWPlayer extraction)
+        try:
+            new_filename = run_ytdlp_download(ytdl_options, url)
 
-            if new_files:
-                new_filename = list(new_files)[0]
+            if logger and DEBUG_MODE:
+                safe_log(logger, 'info', "C-SPAN video download completed")
 
-                # Sanitize filename if needed
-                has_special_chars = any(ord(c) >= 128 for c in new_filename)
-                if has_special_chars:
-                    safe_name = sanitize_filename(new_filename)
-                    if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
-                        ext = new_filename.split(".")[-1]
-                        safe_name = f"{safe_name}.{ext}"
+        except Exception as e:
+            if logger: safe_log(logger, 'error', f"C-SPAN video download failed. Unable to extract JWPlayer stream. C-SPAN video may be unsupported: {str(e)}")
+            return None, False
 
-                    new_path = cache_dir / new_filename
-                    safe_path = cache_dir / safe_name
+        if new_filename:
+            # Sanitize filename if needed
+            has_special_chars = not is_ascii(new_filename)
+            if has_special_chars:
+                safe_name = sanitize_filename(new_filename)
+                if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
+                    ext = new_filename.split(".")[-1]
+                    safe_name = f"{safe_name}.{ext}"
 
-                    try:
-                        new_path.rename(safe_path)
-                        new_filename = safe_name
-                        if logger and DEBUG_MODE:
-                            safe_log(logger, 'info', f"Renamed C-SPAN file to: {safe_name}")
-                    except Exception as e:
-                        if logger: safe_log(logger, 'error', f"Error renaming C-SPAN file: {str(e)}")
+                new_path = cache_dir / new_filename
+                safe_path = cache_dir / safe_name
 
-                # Add to video manager with C-SPAN platform identifier
-                manager.add_video(url, title, new_filename)
-                if logger: safe_log(logger, 'info', f"Successfully downloaded C-SPAN video: {new_filename}")
-                return new_filename, False
-            else:
-                # Fallback: look for recent files
-                recent_time = datetime.datetime.now() - datetime.timedelta(minutes=2)
-                recent_files = [f for f in cache_dir.iterdir()
-                               if f.is_file() and f.stat().st_mtime > recent_time.timestamp()]
-
-                if recent_files:
-                    recent_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                    newest_file = recent_files[0]
-                    manager.add_video(url, title, newest_file.name)
+                try:
+                    new_path.rename(safe_path)
+                    new_filename = safe_name
                     if logger and DEBUG_MODE:
-                        safe_log(logger, 'info', f"Using recent C-SPAN file: {newest_file.name}")
-                    return newest_file.name, False
+                        safe_log(logger, 'info', f"Renamed C-SPAN file to: {safe_name}")
+                except Exception as e:
+                    if logger: safe_log(logger, 'error', f"Error renaming C-SPAN file: {str(e)}")
 
-        finally:
-            try:
-                os.chdir(current_dir)
-            except Exception as e:
-                if logger and DEBUG_MODE:
-                    safe_log(logger, 'warning', f"Error changing back to original directory: {e}")
+            # Add to video manager with C-SPAN platform identifier
+            manager.add_video(url, title, new_filename)
+            if logger: safe_log(logger, 'info', f"Successfully downloaded C-SPAN video: {new_filename}")
+            return new_filename, False
 
-        if logger: safe_log(logger, 'error', "C-SPAN video download failed - no files found")
+        if logger: safe_log(logger, 'error', "C-SPAN video download failed - no file reported by yt-dlp")
         return None, False
 
     except Exception as e:
@@ -1956,7 +2624,7 @@ def download_generic_video(url, cache_dir, manager, logger=None):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
 
-        response = requests.get(url, headers=headers, timeout=30)
+        response = _HTTP_SESSION.get(url, headers=headers, timeout=30)
         response.raise_for_status()
 
         # Parse HTML
@@ -2026,14 +2694,13 @@ def download_generic_video(url, cache_dir, manager, logger=None):
         if logger and DEBUG_MODE:
             safe_log(logger, 'info', f"Downloading: {video_url}")
 
-        video_response = requests.get(video_url, headers=headers, stream=True, timeout=60)
-        video_response.raise_for_status()
+        with _HTTP_SESSION.get(video_url, headers=headers, stream=True, timeout=60) as video_response:
+            video_response.raise_for_status()
 
-        # Write file in chunks
-        with open(file_path, 'wb') as f:
-            for chunk in video_response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
+            # Copy the raw stream in C with 1MB buffers instead of 8KB Python-level writes
+            video_response.raw.decode_content = True
+            with open(file_path, 'wb') as f:
+                shutil.copyfileobj(video_response.raw, f, DOWNLOAD_CHUNK_SIZE)
 
         # Add to video manager with Generic platform
         manager.add_video(url, title_text, filename, platform=domain)
@@ -2050,6 +2717,49 @@ def download_generic_video(url, cache_dir, manager, logger=None):
         if logger: safe_log(logger, 'error', f"Error in generic video download: {str(e)}")
         return None, False
 
+# Site-specific downloaders keyed by domain: (log label, downloader, takes ffmpeg_plugin)
+_SITE_DOWNLOADERS = {
+    'twitter.com': ('Twitter/X', download_twitter_video, False),
+    'x.com': ('Twitter/X', download_twitter_video, False),
+    'archive.org': ('Archive.org', download_archive_video, False),
+    'reddit.com': ('Reddit', download_reddit_video, True),
+    'redd.it': ('Reddit', download_reddit_video, True),
+    'cnn.com': ('CNN', download_cnn_video, True),
+    'c-span.org': ('C-SPAN', download_cspan_video, True),
+}
+
+def site_domain(url):
+    """Return the _SITE_DOWNLOADERS domain matching url's host or a parent domain, or None."""
+    host = urllib.parse.urlsplit(url if '//' in url else '//' + url).hostname or ''
+    while host:
+        if host in _SITE_DOWNLOADERS:
+            return host
+        host = host.partition('.')[2]
+    return None
+
+def log_download_complete(manager, url, filename, logger):
+    """Print the console completion message with the downloaded video's title."""
+    video_data = manager.videos.get(url)
+    if video_data is None or video_data.get('filename') != filename:
+        video_data = manager.get_video_by_filename(filename)
+    if video_data:
+        safe_log(logger, 'info', f"Video download of '{video_data['title']}' complete", console_only=True)
+
+def download_result_response(filename, from_cache):
+    """Build the JSON response body for a finished /download request."""
+    if filename:
+        return {
+            'filename': filename, 
+            'fromCache': from_cache,
+            'success': True
+        }
+    return {
+        'error': 'Download failed',
+        'details': 'Could not download video. Check logs for details.',
+        'suggestion': 'Try a different quality setting or check if the URL is valid',
+        'success': False
+    }
+
 def download_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=None):
     """Main download function with format 18 priority and optional FFmpeg."""
     try:
@@ -2057,9 +2767,11 @@ def download_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=None):
         if logger: safe_log(logger, 'info', f"Starting download: {url}")
         
         # Check if already cached
+        known_title = None
         if url in manager.videos:
             filename = manager.videos[url]['filename']
             file_path = cache_dir / filename
+            known_title = manager.videos[url].get('title')
             if file_path.exists():
                 title = manager.videos[url]['title']
                 safe_log(logger, 'info', f"Video download of '{title}' complete (from cache)", console_only=True)
@@ -2069,205 +2781,129 @@ def download_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=None):
                 if logger and DEBUG_MODE: 
                     safe_log(logger, 'warning', f"Cached file not found: {filename}")
         
-        # Special handling for Twitter/X
-        if "twitter.com" in url or "x.com" in url:
-            if logger and DEBUG_MODE: 
-                safe_log(logger, 'info', f"Detected Twitter/X URL")
-            result = download_twitter_video(url, cache_dir, manager, logger)
-            if result[0]:
-                safe_log(logger, 'info', f"Video download of 'Twitter/X Video' complete", console_only=True)
-            return result
-        
-        # Special handling for Archive.org
-        if "archive.org" in url:
-            if logger and DEBUG_MODE:
-                safe_log(logger, 'info', f"Detected Archive.org URL")
-            result = download_archive_video(url, cache_dir, manager, logger)
-            if result[0]:
-                # Get title from manager for console output
-                for video_url, video_data in manager.videos.items():
-                    if video_data['filename'] == result[0]:
-                        safe_log(logger, 'info', f"Video download of '{video_data['title']}' complete", console_only=True)
-                        break
-            return result
-
-        # Special handling for Reddit
-        if "reddit.com" in url or "redd.it" in url:
-            if logger and DEBUG_MODE:
-                safe_log(logger, 'info', f"Detected Reddit URL")
-            result = download_reddit_video(url, cache_dir, manager, logger, ffmpeg_plugin)
-            if result[0]:
-                # Get title from manager for console output
-                for video_url, video_data in manager.videos.items():
-                    if video_data['filename'] == result[0]:
-                        safe_log(logger, 'info', f"Video download of '{video_data['title']}' complete", console_only=True)
-                        break
-            return result
-
-        # Special handling for CNN
-        if "cnn.com" in url:
+        # Special handling for sites with their own downloader
+        site = _SITE_DOWNLOADERS.get(site_domain(url))
+        if site:
+            label, downloader, uses_ffmpeg = site
             if logger and DEBUG_MODE:
-                safe_log(logger, 'info', f"Detected CNN URL")
-            result = download_cnn_video(url, cache_dir, manager, logger, ffmpeg_plugin)
-            if result[0]:
-                # Get title from manager for console output
-                for video_url, video_data in manager.videos.items():
-                    if video_data['filename'] == result[0]:
-                        safe_log(logger, 'info', f"Video download of '{video_data['title']}' complete", console_only=True)
-                        break
-            return result
-
-        # Special handling for C-SPAN
-        if "c-span.org" in url:
-            if logger and DEBUG_MODE:
-                safe_log(logger, 'info', f"Detected C-SPAN URL")
-            result = download_cspan_video(url, cache_dir, manager, logger, ffmpeg_plugin)
+                safe_log(logger, 'info', f"Detected {label} URL")
+            if uses_ffmpeg:
+                result = downloader(url, cache_dir, manager, logger, ffmpeg_plugin)
+            else:
+                result = downloader(url, cache_dir, manager, logger)
             if result[0]:
-                # Get title from manager for console output
-                for video_url, video_data in manager.videos.items():
-                    if video_data['filename'] == result[0]:
-                        safe_log(logger, 'info', f"Video download of '{video_data['title']}' complete", console_only=True)
-                        break
+                log_download_complete(manager, url, result[0], logger)
             return result
         
         # Handle YouTube videos with improved format selection
-        current_dir = os.getcwd()
-        try:
-            os.chdir(str(cache_dir))
-            
+        if known_title and known_title != 'unknown':
+            # Re-downloading a playlist entry whose file went missing; the title is already known
+            title = known_title
+        else:
             try:
                 # Get info and title first
-                with yt_dlp.YoutubeDL({
-                    'skip_download': True,
-                    'quiet': True,
-                    'no_warnings': True
-                }) as ydl:
-                    info = ydl.extract_info(url, download=False)
-                    title = info.get('title', 'unknown')
+                info = extract_video_info(url)
+                title = info.get('title', 'unknown')
                 
                 if logger and DEBUG_MODE: 
                     safe_log(logger, 'info', f"Video title: {title}")
             except Exception as e:
                 if logger: safe_log(logger, 'error', f"Error getting video info: {e}")
                 title = "unknown"
-            
-            # Track files before download
-            before_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-            
-            # Get format options based on quality preference and FFmpeg availability
-            quality_preference = get_quality_preference()
-            if ffmpeg_plugin is None:
-                ffmpeg_plugin = FFmpegPlugin(logger)
-            
-            format_options = get_format_options(quality_preference, ffmpeg_plugin)
-            
-            if logger and DEBUG_MODE: 
-                safe_log(logger, 'info', f"Quality preference: {quality_preference}")
-                safe_log(logger, 'info', f"FFmpeg available: {ffmpeg_plugin.available}")
-            
-            download_success = False
-            used_format = None
-            
-            for format_selector in format_options:
-                try:
-                    if logger and DEBUG_MODE: 
-                        safe_log(logger, 'info', f"Trying format: {format_selector}")
-                    
-                    # Base options
-                    ytdl_options = {
-                        'format': format_selector,
-                        'outtmpl': '%(title)s.%(ext)s',
-                        'quiet': True,
-                        'no_warnings': True,
-                        'writeinfojson': False,
-                        'writedescription': False,
-                        'writesubtitles': False,
-                        'writeautomaticsub': False,
-                    }
-                    
-                    # Apply FFmpeg plugin options if available
-                    if ffmpeg_plugin and ffmpeg_plugin.available:
-                        ytdl_options = ffmpeg_plugin.get_ytdl_options(ytdl_options)
-                    
-                    # Download the video with current format
-                    with yt_dlp.YoutubeDL(ytdl_options) as ydl:
-                        ydl.download([url])
-                    
-                    download_success = True
-                    used_format = format_selector
-                    if logger and DEBUG_MODE: 
-                        safe_log(logger, 'info', f"Download successful with format: {format_selector}")
-                    break
-                    
-                except Exception as format_error:
-                    if logger and DEBUG_MODE: 
-                        safe_log(logger, 'warning', f"Format {format_selector} failed: {str(format_error)}")
-                    continue
-            
-            if not download_success:
-                if logger: safe_log(logger, 'error', "All format options failed, trying generic HTML5 video fallback")
-                # Try generic HTML5 video fallback
-                return download_generic_video(url, cache_dir, manager, logger)
-            
-            # Find new files
-            after_files = set(f.name for f in cache_dir.iterdir() if f.is_file())
-            new_files = after_files - before_files
-            
-            if new_files:
-                # Use the new file
-                new_filename = list(new_files)[0]
+        
+        # Get format options based on quality preference and FFmpeg availability
+        quality_preference = get_quality_preference()
+        if ffmpeg_plugin is None:
+            ffmpeg_plugin = FFmpegPlugin(logger)
+        
+        format_options = get_format_options(quality_preference, ffmpeg_plugin)
+        
+        if logger and DEBUG_MODE: 
+            safe_log(logger, 'info', f"Quality preference: {quality_preference}")
+            safe_log(logger, 'info', f"FFmpeg available: {ffmpeg_plugin.available}")
+        
+        download_success = False
+        used_format = None
+        new_filename = None
+        
+        # Base options, shared by every format attempt
+        base_options = {
+            'outtmpl': '%(title)s.%(ext)s',
+            'paths': {'home': str(cache_dir)},
+            'quiet': True,
+            'no_warnings': True,
+            'writeinfojson': False,
+            'writedescription': False,
+            'writesubtitles': False,
+            'writeautomaticsub': False,
+        }
+        
+        # Apply FFmpeg plugin options if available
+        if ffmpeg_plugin and ffmpeg_plugin.available:
+            base_options = ffmpeg_plugin.get_ytdl_options(base_options)
+        
+        for format_selector in format_options:
+            try:
+                if logger and DEBUG_MODE: 
+                    safe_log(logger, 'info', f"Trying format: {format_selector}")
                 
-                # Sanitize if needed (has special chars)
-                has_special_chars = any(ord(c) >= 128 for c in new_filename)
-                if has_special_chars:
-                    # Create safe filename
-                    safe_name = sanitize_filename(new_filename)
-                    
-                    # Keep original extension
-                    if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
-                        ext = new_filename.split(".")[-1]
-                        safe_name = f"{safe_name}.{ext}"
-                    
-                    # Rename file
-                    new_path = cache_dir / new_filename
-                    safe_path = cache_dir / safe_name
-                    
-                    try:
-                        new_path.rename(safe_path)
-                        new_filename = safe_name  # Update to use the sanitized name
-                        if logger and DEBUG_MODE: 
-                            safe_log(logger, 'info', f"Renamed file to: {safe_name}")
-                    except Exception as e:
-                        if logger: safe_log(logger, 'error', f"Error renaming: {str(e)}")
+                # yt-dlp compiles the format selector when it is constructed,
+                # so each attempt still needs its own downloader
+                ytdl_options = dict(base_options, format=format_selector)
                 
-                # Add video with the final filename (sanitized if needed)
-                manager.add_video(url, title, new_filename)
-                safe_log(logger, 'info', f"Video download of '{title}' complete", console_only=True)
-                if logger and DEBUG_MODE: 
-                    safe_log(logger, 'info', f"Video added with format: {used_format}")
-                return new_filename, False
-            
-            # Fallback: look for recent files
-            recent_time = datetime.datetime.now() - datetime.timedelta(minutes=2)
-            recent_files = [f for f in cache_dir.iterdir() 
-                           if f.is_file() and f.stat().st_mtime > recent_time.timestamp()]
-            
-            if recent_files:
-                recent_files.sort(key=lambda f: f.stat().st_mtime, reverse=True)
-                newest_file = recent_files[0]
-                manager.add_video(url, title, newest_file.name)
-                safe_log(logger, 'info', f"Video download of '{title}' complete", console_only=True)
+                # Download the video with current format
+                new_filename = run_ytdlp_download(ytdl_options, url)
+                
+                download_success = True
+                used_format = format_selector
                 if logger and DEBUG_MODE: 
-                    safe_log(logger, 'info', f"Using recent file: {newest_file.name}")
-                return newest_file.name, False
+                    safe_log(logger, 'info', f"Download successful with format: {format_selector}")
+                break
                 
-        finally:
-            try:
-                os.chdir(current_dir)
-            except Exception as e:
+            except Exception as format_error:
                 if logger and DEBUG_MODE: 
-                    safe_log(logger, 'warning', f"Error changing back to original directory: {e}")
+                    safe_log(logger, 'warning', f"Format {format_selector} failed: {str(format_error)}")
+                continue
+        
+        if not download_success:
+            if logger: safe_log(logger, 'error', "All format options failed, trying generic HTML5 video fallback")
+            # Try generic HTML5 video fallback
+            return download_generic_video(url, cache_dir, manager, logger)
+        
+        if new_filename:
+            # Sanitize if needed (has special chars)
+            has_special_chars = not is_ascii(new_filename)
+            if has_special_chars:
+                # Create safe filename
+                safe_name = sanitize_filename(new_filename)
                 
+                # Keep original extension
+                if "." in new_filename and not safe_name.endswith(new_filename.split(".")[-1]):
+                    ext = new_filename.split(".")[-1]
+                    safe_name = f"{safe_name}.{ext}"
+                
+                # Rename file
+                new_path = cache_dir / new_filename
+                safe_path = cache_dir / safe_name
+                
+                try:
+                    new_path.rename(safe_path)
+                    new_filename = safe_name  # Update to use the sanitized name
+                    if logger and DEBUG_MODE: 
+                        safe_log(logger, 'info', f"Renamed file to: {safe_name}")
+                except Exception as e:
+                    if logger: safe_log(logger, 'error', f"Error renaming: {str(e)}")
+            
+            # Add video with the final filename (sanitized if needed)
+            manager.add_video(url, title, new_filename)
+            safe_log(logger, 'info', f"Video download of '{title}' complete", console_only=True)
+            if logger and DEBUG_MODE: 
+                safe_log(logger, 'info', f"Video added with format: {used_format}")
+            return new_filename, False
+        
+        if logger: safe_log(logger, 'error', "Download finished but yt-dlp reported no output file")
+        return None, False
+
     except Exception as e:
         if logger: safe_log(logger, 'error', f"Error in download_video: {str(e)}")
         if DEBUG_MODE:
@@ -2275,80 +2911,354 @@ def download_video(url, cache_dir, manager, logger=None, ffmpeg_plugin=None):
         return None, False
 
 # HTTP Request Handler with comprehensive error handling
+_RANGE_HEADER_RE = re.compile(r'bytes=(\d*)-(\d*)$')
+
+def parse_range_header(value, size):
+    """Parse a single-range Range header into (start, end).
+    
+    Returns None when the whole file should be sent (no header, a form we
+    don't handle such as multiple ranges, or an invalid last < first range
+    that RFC 7233 says to ignore) and False when the range is unsatisfiable.
+    
+    >>> parse_range_header('bytes=0-99', 1000)
+    (0, 99)
+    >>> parse_range_header('bytes=-500', 1000)
+    (500, 999)
+    >>> parse_range_header('bytes=-500', 0)
+    False
+    >>> parse_range_header('bytes=1000-', 1000)
+    False
+    >>> parse_range_header('bytes=5-2', 1000) is None
+    True
+    """
+    if not value:
+        return None
+    match = _RANGE_HEADER_RE.match(value.strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first:
+        if not last:
+            return None
+        # Suffix range: the final N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        # Syntactically invalid, so the header is ignored rather than answered with 416
+        return None
+    if start >= size:
+        return False
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+# Cached videos may be replaced under the same name (redownload, repair), so
+# browsers keep them for a day and then revalidate against the ETag
+_VIDEO_CACHE_CONTROL = 'private, max-age=86400'
+
+def etag_matches(if_none_match, etag):
+    """Return True if an If-None-Match header value lists etag (weak comparison, as for GET)."""
+    opaque = etag[2:] if etag.startswith('W/') else etag
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or (tag[2:] if tag.startswith('W/') else tag) == opaque:
+            return True
+    return False
+
+def is_not_modified(headers, etag, mtime):
+    """Return True if the request's If-None-Match / If-Modified-Since still match the file."""
+    if_none_match = headers.get('If-None-Match')
+    if if_none_match is not None:
+        # If-None-Match wins over If-Modified-Since
+        return etag_matches(if_none_match, etag)
+    if_modified_since = headers.get('If-Modified-Since')
+    if if_modified_since:
+        try:
+            since = email.utils.parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError, IndexError):
+            return False
+        return since is not None and int(mtime) <= since.timestamp()
+    return False
+
+# (second, formatted Date header) shared by all handler threads
+_http_date = (None, '')
+
+# The whole /heartbeat reply, written in one call. The handler speaks the
+# default HTTP/1.0, so the connection closes after the body as before.
+_HEARTBEAT_RESPONSE = (b"HTTP/1.0 200 OK\r\n"
+                       b"Content-type: text/plain\r\n"
+                       b"Content-Length: 5\r\n"
+                       b"\r\n"
+                       b"alive")
+
+# errno values that only mean the client went away mid-response
+_CLIENT_DISCONNECT_ERRNOS = frozenset((errno.ECONNRESET, errno.EPIPE, errno.ECONNABORTED,
+                                       errno.ETIMEDOUT, errno.ENOTCONN))
+
+def is_client_disconnect(error):
+    """Return True if an OSError means the client dropped the connection, not a server fault."""
+    return (isinstance(error, (ConnectionError, socket.timeout))
+            or error.errno in _CLIENT_DISCONNECT_ERRNOS)
+
+def open_video_file(path):
+    """Open path for binary reading, or return None if it is missing or not a file."""
+    try:
+        return open(path, 'rb')
+    except OSError:
+        # Missing, a directory (IsADirectoryError / PermissionError on Windows), or unreadable
+        return None
+
+@contextlib.contextmanager
+def tcp_cork(sock):
+    """Hold back partial TCP segments until the block exits (Linux TCP_CORK; no-op elsewhere)."""
+    cork = getattr(socket, 'TCP_CORK', None)
+    if cork is not None:
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, cork, 1)
+        except OSError:
+            cork = None
+    try:
+        yield
+    finally:
+        if cork is not None:
+            try:
+                sock.setsockopt(socket.IPPROTO_TCP, cork, 0)
+            except OSError:
+                pass
+
+def query_param(path, name):
+    """Return the first decoded value of name in path's query string, or ''."""
+    for pair in path.partition('?')[2].split('&'):
+        key, _, value = pair.partition('=')
+        if key == name:
+            return urllib.parse.unquote_plus(value)
+    return ''
+
+# Seconds between SSE comment lines on an idle /events stream, so proxies and
+# the browser keep the connection and a vanished client is noticed
+EVENT_STREAM_KEEPALIVE = 15
+
+# Fixed JSON bodies for the POST endpoints that only report success
+_SUCCESS_JSON = b'{"success":true}'
+_FAILURE_JSON = b'{"success":false}'
+
 class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
+    def setup(self):
+        """Disable Nagle so small replies are not held back waiting for an ACK."""
+        super().setup()
+        try:
+            self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except (OSError, AttributeError):
+            pass
+
     def log_message(self, format, *args):
         """Override to use our logger with debug control."""
         try:
-            if hasattr(self.server, 'logger') and DEBUG_MODE:
+            if DEBUG_MODE and hasattr(self.server, 'logger'):
                 safe_log(self.server.logger, 'info', f"{self.address_string()} - {format % args}")
         except Exception:
             pass
 
+    def date_time_string(self, timestamp=None):
+        """Format an HTTP date; the current-time Date header is formatted once per second."""
+        global _http_date
+        if timestamp is not None:
+            return super().date_time_string(timestamp)
+        now = int(time.time())
+        cached = _http_date
+        if cached[0] != now:
+            cached = _http_date = (now, email.utils.formatdate(now, usegmt=True))
+        return cached[1]
+
+    def copy_file_to_client(self, f, offset, count):
+        """Send count bytes of f starting at offset, using os.sendfile() where available."""
+        sendfile = getattr(os, 'sendfile', None)
+        if sendfile is not None:
+            try:
+                out_fd = self.wfile.fileno()
+                in_fd = f.fileno()
+            except (AttributeError, OSError):
+                sendfile = None
+        if sendfile is not None:
+            self.wfile.flush()
+            try:
+                while count > 0:
+                    sent = sendfile(out_fd, in_fd, offset, min(count, SENDFILE_CHUNK_SIZE))
+                    if not sent:
+                        return
+                    offset += sent
+                    count -= sent
+                return
+            except ConnectionError:
+                raise
+            except OSError:
+                # Socket or file type not supported by sendfile; copy the rest in Python
+                pass
+        f.seek(offset)
+        while count > 0:
+            chunk = f.read(min(count, DOWNLOAD_CHUNK_SIZE))
+            if not chunk:
+                return
+            self.wfile.write(chunk)
+            count -= len(chunk)
+
+    def read_request_body(self, max_bytes):
+        """Read a POST body of at most max_bytes; sends an error and returns None otherwise."""
+        try:
+            length = int(self.headers.get('Content-Length', ''))
+        except ValueError:
+            self.send_error(411, "Content-Length required")
+            return None
+        if length < 0:
+            self.send_error(400, "Invalid Content-Length")
+            return None
+        if length > max_bytes:
+            # The body is left unread, so the connection cannot be reused
+            self.close_connection = True
+            self.send_error(413, "Request body too large")
+            return None
+        
+        body = bytearray()
+        remaining = length
+        while remaining:
+            chunk = self.rfile.read(min(remaining, POST_READ_CHUNK_SIZE))
+            if not chunk:
+                break
+            body += chunk
+            remaining -= len(chunk)
+        return bytes(body)
+
+    def send_json(self, body, code=200, extra_headers=''):
+        """Send an encoded JSON body with its status line and headers in a single write.
+        
+        extra_headers is preformatted header text, each line ending in CRLF.
+        """
+        self.log_request(code)
+        head = '%s %d %s\r\nContent-type: application/json\r\nContent-Length: %d\r\n%s\r\n' % (
+            self.protocol_version, code, self.responses[code][0], len(body), extra_headers)
+        self.wfile.write(head.encode('latin-1') + body)
+
+    def stream_playlist_events(self):
+        """Push the playlist as server-sent events: once on connect, then on every change.
+        
+        Each event's id is the playlist version, matching /playlist's
+        X-Playlist-Version header, so the page can skip snapshots it already has.
+        """
+        if not self.server.open_event_stream():
+            # The page falls back to polling /playlist
+            self.send_error(503, "Too many event streams")
+            return
+        try:
+            manager = self.server.video_manager
+            self.send_response(200)
+            self.send_header('Content-type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            
+            version = None
+            while not self.server.shutdown_event.is_set():
+                change = manager.wait_for_change(version, EVENT_STREAM_KEEPALIVE)
+                if change is None:
+                    self.wfile.write(b': keepalive\n\n')
+                    continue
+                version, body = change
+                # Compact JSON has no raw newlines, so it fits on one data line
+                self.wfile.write(b'event: playlist\nid: %d\ndata: %s\n\n' % (version, body))
+        finally:
+            self.server.close_event_stream()
+
+    def send_html_page(self, path):
+        """Send a cached HTML page, gzip-compressed when the client accepts it."""
+        try:
+            body, gzipped, etag = self.server.page_cache.get(path)
+        except FileNotFoundError:
+            body, gzipped, etag = f'<h1>Error: {path} not found</h1>'.encode('utf-8'), None, None
+        
+        if_none_match = self.headers.get('If-None-Match')
+        if etag is not None and if_none_match is not None and etag_matches(if_none_match, etag):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Vary', 'Accept-Encoding')
+            self.end_headers()
+            return
+        
+        self.send_response(200)
+        self.send_header('Content-type', 'text/html')
+        if etag is not None:
+            self.send_header('ETag', etag)
+        if gzipped is not None and 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzipped
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('Vary', 'Accept-Encoding')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def copyfile(self, source, outputfile):
+        """Static files served by SimpleHTTPRequestHandler go through sendfile() too."""
+        if outputfile is self.wfile:
+            try:
+                offset = source.tell()
+                count = os.fstat(source.fileno()).st_size - offset
+            except (AttributeError, OSError):
+                pass
+            else:
+                self.copy_file_to_client(source, offset, count)
+                return
+        super().copyfile(source, outputfile)
+
     def do_GET(self):
         try:
-            if self.path == '/':
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                try:
-                    with open('player.html', 'r', encoding='utf-8') as f:
-                        self.wfile.write(f.read().encode('utf-8'))
-                except FileNotFoundError:
-                    self.wfile.write(b'<h1>Error: player.html not found</h1>')
+            # Polled by every open tab, so it is checked before any other route
+            if self.path == '/heartbeat':
+                self.wfile.write(_HEARTBEAT_RESPONSE)
+                # Don't log heartbeat unless in debug mode
+                if DEBUG_MODE and hasattr(self.server, 'logger'):
+                    safe_log(self.server.logger, 'info', "Heartbeat received")
+                return
+
+            elif self.path == '/':
+                self.send_html_page('player.html')
                 return
 
             elif self.path == '/manual':
-                self.send_response(200)
-                self.send_header('Content-type', 'text/html')
-                self.end_headers()
-                try:
-                    with open('manual.html', 'r', encoding='utf-8') as f:
-                        self.wfile.write(f.read().encode('utf-8'))
-                except FileNotFoundError:
-                    self.wfile.write(b'<h1>Error: manual.html not found</h1>')
+                self.send_html_page('manual.html')
                 return
 
             elif self.path == '/playlist':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
+                encoding_headers = 'Vary: Accept-Encoding\r\n'
                 try:
-                    videos = self.server.video_manager.get_sorted_videos()
-                    self.wfile.write(json.dumps(videos).encode('utf-8'))
+                    gzipped = 'gzip' in self.headers.get('Accept-Encoding', '')
+                    version, body = self.server.video_manager.get_playlist_snapshot(gzipped)
+                    if gzipped:
+                        encoding_headers = 'Content-Encoding: gzip\r\n' + encoding_headers
+                    encoding_headers += 'X-Playlist-Version: %d\r\n' % version
                 except Exception as e:
                     safe_log(self.server.logger, 'error', f"Error getting playlist: {e}")
-                    self.wfile.write(b'[]')
+                    body = b'[]'
+                    encoding_headers = 'Vary: Accept-Encoding\r\n'
+                self.send_json(body, extra_headers=encoding_headers)
+                return
+
+            elif self.path == '/events':
+                self.stream_playlist_events()
                 return
 
             elif self.path == '/webpages':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
                 try:
-                    webpages = self.server.webpage_manager.get_sorted_webpages()
-                    self.wfile.write(json.dumps(webpages).encode('utf-8'))
+                    body = dump_json_bytes(self.server.webpage_manager.get_sorted_webpages(), compact=True)
                 except Exception as e:
                     safe_log(self.server.logger, 'error', f"Error getting webpages: {e}")
-                    self.wfile.write(b'[]')
-                return
-
-            elif self.path == '/heartbeat':
-                self.send_response(200)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'alive')
-                # Don't log heartbeat unless in debug mode
-                if DEBUG_MODE and hasattr(self.server, 'logger'):
-                    safe_log(self.server.logger, 'info', "Heartbeat received")
+                    body = b'[]'
+                self.send_json(body)
                 return
 
             elif self.path == '/quality_settings':
-                self.send_response(200)
-                self.send_header('Content-type', 'application/json')
-                self.end_headers()
                 try:
                     settings = {
                         'quality_preference': get_quality_preference(),
@@ -2359,10 +3269,11 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                             'high': 'Best quality - 1080p with FFmpeg merging (requires FFmpeg)'
                         }
                     }
-                    self.wfile.write(json.dumps(settings).encode('utf-8'))
+                    body = dump_json_bytes(settings, compact=True)
                 except Exception as e:
                     safe_log(self.server.logger, 'error', f"Error getting quality settings: {e}")
-                    self.wfile.write(b'{"error": "Could not load settings"}')
+                    body = b'{"error": "Could not load settings"}'
+                self.send_json(body)
                 return
 
             elif self.path.startswith('/download?'):
@@ -2377,7 +3288,7 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                     
                     safe_log(self.server.logger, 'info', f"Download request for: {url}")
                     
-                    filename, from_cache = download_video(
+                    download_args = (
                         url, 
                         self.server.cache_dir, 
                         self.server.video_manager, 
@@ -2385,30 +3296,43 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                         self.server.ffmpeg_plugin
                     )
                     
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    
-                    if filename:
-                        response = {
-                            'filename': filename, 
-                            'fromCache': from_cache,
-                            'success': True
-                        }
+                    if params.get('async', [''])[0] == '1':
+                        # Queue the download and let the client poll /download_status
+                        job_id = self.server.download_jobs.submit(url, download_video, *download_args)
+                        response = {'job_id': job_id, 'status': 'queued', 'success': True}
                     else:
-                        response = {
-                            'error': 'Download failed',
-                            'details': 'Could not download video. Check logs for details.',
-                            'suggestion': 'Try a different quality setting or check if the URL is valid',
-                            'success': False
-                        }
+                        filename, from_cache = download_video(*download_args)
+                        response = download_result_response(filename, from_cache)
                     
-                    self.wfile.write(json.dumps(response).encode('utf-8'))
+                    self.send_json(dump_json_bytes(response, compact=True))
                 except Exception as e:
                     safe_log(self.server.logger, 'error', f"Error in download handler: {e}")
                     self.send_error(500, f"Download error: {str(e)}")
                 return
 
+            elif self.path.startswith('/download_status?'):
+                query = urllib.parse.urlparse(self.path).query
+                params = urllib.parse.parse_qs(query)
+                job = self.server.download_jobs.get(params.get('job_id', [''])[0])
+                if job is None:
+                    self.send_error(404, "Unknown download job")
+                    return
+                
+                job_url, future = job
+                if not future.done():
+                    response = {'status': 'running' if future.running() else 'queued', 'url': job_url}
+                else:
+                    try:
+                        filename, from_cache = future.result()
+                    except Exception as e:
+                        safe_log(self.server.logger, 'error', f"Error in background download: {e}")
+                        filename, from_cache = None, False
+                    response = download_result_response(filename, from_cache)
+                    response.update({'status': 'done', 'url': job_url})
+                
+                self.send_json(dump_json_bytes(response, compact=True))
+                return
+
             elif self.path.startswith('/filestats?'):
                 try:
                     query = urllib.parse.urlparse(self.path).query
@@ -2417,19 +3341,21 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                     
                     if filename:
                         file_path = self.server.cache_dir / filename
-                        if file_path.exists():
-                            stats = file_path.stat()
-                            
+                        try:
+                            stats = os.stat(file_path)
+                        except FileNotFoundError:
+                            stats = None
+                        if stats is not None:
                             # Try to load enhanced metadata
                             enhanced_metadata = None
                             metadata_file = self.server.cache_dir / f"{filename}.metadata.json"
-                            if metadata_file.exists():
-                                try:
-                                    with open(metadata_file, 'r', encoding='utf-8') as f:
-                                        enhanced_metadata = json.load(f)
-                                except Exception as e:
-                                    if DEBUG_MODE:
-                                        safe_log(self.server.logger, 'warning', f"Could not load metadata for {filename}: {e}")
+                            try:
+                                enhanced_metadata = read_json_file(metadata_file)
+                            except FileNotFoundError:
+                                pass
+                            except Exception as e:
+                                if DEBUG_MODE:
+                                    safe_log(self.server.logger, 'warning', f"Could not load metadata for {filename}: {e}")
                             
                             response = {
                                 'size': stats.st_size,
@@ -2442,10 +3368,7 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                     else:
                         response = {'error': 'No filename provided'}
                     
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(response).encode('utf-8'))
+                    self.send_json(dump_json_bytes(response, compact=True))
                 except Exception as e:
                     safe_log(self.server.logger, 'error', f"Error getting file stats: {e}")
                     self.send_error(500, str(e))
@@ -2461,66 +3384,96 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
                     safe_log(self.server.logger, 'info', f"Requesting file: {filename} (original: {encoded_filename})")
                     
                     file_path = self.server.cache_dir / filename
+                    video_file = open_video_file(file_path)
                     
                     # If the exact filename doesn't exist, try sanitized version
-                    if not file_path.exists():
+                    if video_file is None:
                         sanitized_filename = sanitize_filename(filename)
                         file_path = self.server.cache_dir / sanitized_filename
                         safe_log(self.server.logger, 'info', f"Trying sanitized: {sanitized_filename}")
+                        video_file = open_video_file(file_path)
                         
                         # Also try without extension and re-add it
-                        if not file_path.exists() and '.' in filename:
+                        if video_file is None and '.' in filename:
                             name_part = filename.rsplit('.', 1)[0]
                             ext_part = filename.rsplit('.', 1)[1]
                             sanitized_name = sanitize_filename(name_part)
                             file_path = self.server.cache_dir / f"{sanitized_name}.{ext_part}"
                             safe_log(self.server.logger, 'info', f"Trying name+ext: {sanitized_name}.{ext_part}")
+                            video_file = open_video_file(file_path)
                     
                     # Try to find any file that matches the base name (without extension)
-                    if not file_path.exists():
+                    if video_file is None and filename:
                         base_name = filename.rsplit('.', 1)[0] if '.' in filename else filename
                         sanitized_base = sanitize_filename(base_name)
+                        video_index = self.server.video_index
                         
-                        safe_log(self.server.logger, 'info', f"Searching for similar files to: {base_name}")
-                        
-                        # Look for files with similar names
-                        for existing_file in self.server.cache_dir.iterdir():
-                            if existing_file.is_file() and existing_file.suffix in ['.mp4', '.webm', '.avi']:
-                                existing_base = existing_file.stem
-                                existing_name = existing_file.name
-                                
-                                # Try exact match first
-                                if existing_name.lower() == filename.lower():
-                                    file_path = existing_file
-                                    safe_log(self.server.logger, 'info', f"Found exact match: {existing_name}")
-                                    break
-                                
-                                # Try fuzzy matching
-                                if (sanitized_base.lower() in existing_base.lower() or 
-                                    existing_base.lower() in sanitized_base.lower() or
-                                    base_name.lower() in existing_base.lower() or
-                                    existing_base.lower() in base_name.lower()):
-                                    file_path = existing_file
-                                    safe_log(self.server.logger, 'info', f"Found fuzzy match: {existing_name}")
-                                    break
+                        match = video_index.lookup(filename, sanitize_filename(filename), base_name, sanitized_base)
+                        if match is not None:
+                            safe_log(self.server.logger, 'info', f"Found exact match: {match.name}")
+                        else:
+                            safe_log(self.server.logger, 'info', f"Searching for similar files to: {base_name}")
+                            match = video_index.find_similar(sanitized_base, base_name)
+                            if match is not None:
+                                safe_log(self.server.logger, 'info', f"Found fuzzy match: {match.name}")
+                        if match is not None:
+                            file_path = match
+                            video_file = open_video_file(file_path)
                     
-                    if file_path.exists() and file_path.is_file():
+                    if video_file is not None:
                         safe_log(self.server.logger, 'info', f"Serving video file: {file_path.name}")
                         
-                        self.send_response(200)
-                        self.send_header('Content-type', 'video/mp4')
-                        self.send_header('Content-Length', str(file_path.stat().st_size))
-                        self.send_header('Accept-Ranges', 'bytes')
-                        self.end_headers()
-                        
-                        with open(file_path, 'rb') as f:
-                            shutil.copyfileobj(f, self.wfile)
+                        with video_file as f:
+                            file_stat = os.fstat(f.fileno())
+                            file_size = file_stat.st_size
+                            last_modified = self.date_time_string(int(file_stat.st_mtime))
+                            etag = '"%x-%x"' % (file_size, file_stat.st_mtime_ns)
+                            if is_not_modified(self.headers, etag, file_stat.st_mtime):
+                                self.send_response(304)
+                                self.send_header('ETag', etag)
+                                self.send_header('Last-Modified', last_modified)
+                                self.send_header('Cache-Control', _VIDEO_CACHE_CONTROL)
+                                self.end_headers()
+                                return
+                            
+                            byte_range = parse_range_header(self.headers.get('Range'), file_size)
+                            # A stale If-Range validator means the client's partial copy is outdated
+                            if_range = self.headers.get('If-Range')
+                            if byte_range is not None and if_range and if_range.strip() not in (last_modified, etag):
+                                byte_range = None
+                            if byte_range is False:
+                                self.send_response(416)
+                                self.send_header('Content-Range', f'bytes */{file_size}')
+                                self.send_header('Content-Length', '0')
+                                self.end_headers()
+                                return
+                            
+                            # Let the headers ride in the same segment as the first file bytes
+                            with tcp_cork(self.connection):
+                                if byte_range:
+                                    start, end = byte_range
+                                    self.send_response(206)
+                                    self.send_header('Content-Range', f'bytes {start}-{end}/{file_size}')
+                                else:
+                                    start, end = 0, file_size - 1
+                                    self.send_response(200)
+                                self.send_header('Content-type', 'video/mp4')
+                                self.send_header('Content-Length', str(end - start + 1))
+                                self.send_header('Accept-Ranges', 'bytes')
+                                self.send_header('Last-Modified', last_modified)
+                                self.send_header('ETag', etag)
+                                self.send_header('Cache-Control', _VIDEO_CACHE_CONTROL)
+                                self.end_headers()
+                                self.copy_file_to_client(f, start, end - start + 1)
                     else:
                         safe_log(self.server.logger, 'error', f"Video file not found: {filename}")
-                        safe_log(self.server.logger, 'info', f"Available files: {[f.name for f in self.server.cache_dir.iterdir() if f.is_file() and f.suffix in ['.mp4', '.webm', '.avi']]}")
+                        if self.server.logger.isEnabledFor(logging.INFO):
+                            safe_log(self.server.logger, 'info', f"Available files: {self.server.video_index.names()}")
                         self.send_error(404, "Video file not found")
                         
-                except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
+                except OSError as e:
+                    if not is_client_disconnect(e):
+                        raise
                     # Normal network disconnection - don't log as error unless in debug mode
                     if DEBUG_MODE:
                         safe_log(self.server.logger, 'info', f"Client disconnected during video serve: {e}")
@@ -2534,12 +3487,12 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             # If we get here, try default file serving
             super().do_GET()
 
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
-            # Normal network disconnection - don't log as error unless in debug mode
-            if DEBUG_MODE:
-                safe_log(self.server.logger, 'info', f"Client disconnected during request: {e}")
-            # Otherwise, silently ignore these common network events
         except Exception as e:
+            if isinstance(e, OSError) and is_client_disconnect(e):
+                # Normal network disconnection - don't log as error unless in debug mode
+                if DEBUG_MODE:
+                    safe_log(self.server.logger, 'info', f"Client disconnected during request: {e}")
+                return
             safe_log(self.server.logger, 'error', f"Error in do_GET: {e}")
             if DEBUG_MODE:
                 traceback.print_exc()
@@ -2548,252 +3501,250 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             except Exception:
                 pass
 
-    def do_POST(self):
+    def _post_shutdown(self):
+        """Stop the server; main() performs the actual shutdown."""
+        self.send_response(200)
+        self.send_header('Content-type', 'text/plain')
+        self.end_headers()
+        self.wfile.write(b'Shutting down...')
+
+        safe_log(self.server.logger, 'info', "Shutdown requested")
+        console_status("Shutting down application...")
+        # main() is waiting on this event and stops the server itself
+        self.server.shutdown_event.set()
+
+    def _post_quality_settings(self):
+        """Save the download quality preference."""
         try:
-            if self.path == '/shutdown':
-                self.send_response(200)
-                self.send_header('Content-type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'Shutting down...')
-                
-                safe_log(self.server.logger, 'info', "Shutdown requested")
-                console_status("Shutting down application...")
-                threading.Thread(target=self.server.shutdown).start()
+            post_data = self.read_request_body(MAX_SETTINGS_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/quality_settings':
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    
-                    quality_preference = data.get('quality_preference')
-                    if quality_preference in ['reliable', 'medium', 'high']:
-                        success = save_quality_preference(quality_preference)
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        
-                        response = {'success': success}
-                        if success:
-                            console_status(f"Quality preference updated to: {quality_preference}")
-                            safe_log(self.server.logger, 'info', f"Quality preference updated to: {quality_preference}")
-                        else:
-                            response['error'] = 'Failed to save preference'
-                        
-                        self.wfile.write(json.dumps(response).encode('utf-8'))
-                    else:
-                        self.send_error(400, "Invalid quality preference")
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error setting quality preference: {e}")
-                    self.send_error(500, str(e))
-                return
+            quality_preference = data.get('quality_preference')
+            if quality_preference in ['reliable', 'medium', 'high']:
+                success = save_quality_preference(quality_preference)
 
-            elif self.path.startswith('/remove?'):
-                try:
-                    query = urllib.parse.urlparse(self.path).query
-                    params = urllib.parse.parse_qs(query)
-                    url = params.get('url', [''])[0]
-                    
-                    if url:
-                        success = self.server.video_manager.remove_video(url, self.server.logger)
-                        
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({'success': success}).encode('utf-8'))
-                    else:
-                        self.send_error(400, "No URL provided")
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error removing video: {e}")
-                    self.send_error(500, str(e))
-                return
+                if success:
+                    console_status(f"Quality preference updated to: {quality_preference}")
+                    safe_log(self.server.logger, 'info', f"Quality preference updated to: {quality_preference}")
+                    self.send_json(_SUCCESS_JSON)
+                else:
+                    self.send_json(dump_json_bytes({'success': False, 'error': 'Failed to save preference'}, compact=True))
+            else:
+                self.send_error(400, "Invalid quality preference")
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error setting quality preference: {e}")
+            self.send_error(500, str(e))
 
-            elif self.path.startswith('/remove_webpage?'):
-                try:
-                    query = urllib.parse.urlparse(self.path).query
-                    params = urllib.parse.parse_qs(query)
-                    url = params.get('url', [''])[0]
+    def _post_clear_metadata_cache(self):
+        """Drop all cached yt-dlp metadata."""
+        try:
+            clear_metadata_cache()
+            safe_log(self.server.logger, 'info', "Metadata cache cleared")
+            self.send_json(_SUCCESS_JSON)
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error clearing metadata cache: {e}")
+            self.send_error(500, str(e))
 
-                    if url:
-                        success = self.server.webpage_manager.remove_webpage(url, self.server.logger)
+    def _post_remove(self):
+        """Remove a video from the playlist."""
+        try:
+            url = query_param(self.path, 'url')
 
-                        self.send_response(200)
-                        self.send_header('Content-type', 'application/json')
-                        self.end_headers()
-                        self.wfile.write(json.dumps({'success': success}).encode('utf-8'))
-                    else:
-                        self.send_error(400, "No URL provided")
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error removing webpage: {e}")
-                    self.send_error(500, str(e))
-                return
+            if url:
+                success = self.server.video_manager.remove_video(url, self.server.logger)
 
-            elif self.path == '/evidence_reports' and EVIDENCE_CITATION_AVAILABLE:
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-                    
-                    from evidence_generator import create_evidence_report
-                    result = create_evidence_report(
-                        self.server.cache_dir,
-                        data['video_url'],
-                        data['video_filename'],
-                        data.get('case_info')
-                    )
-                    
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error generating evidence report: {e}")
-                    self.send_error(500, str(e))
+                self.send_json(_SUCCESS_JSON if success else _FAILURE_JSON)
+            else:
+                self.send_error(400, "No URL provided")
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error removing video: {e}")
+            self.send_error(500, str(e))
+
+    def _post_remove_webpage(self):
+        """Remove an archived webpage."""
+        try:
+            url = query_param(self.path, 'url')
+
+            if url:
+                success = self.server.webpage_manager.remove_webpage(url, self.server.logger)
+
+                self.send_json(_SUCCESS_JSON if success else _FAILURE_JSON)
+            else:
+                self.send_error(400, "No URL provided")
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error removing webpage: {e}")
+            self.send_error(500, str(e))
+
+    def _post_evidence_reports(self):
+        """Generate an evidence report for a cached video."""
+        try:
+            post_data = self.read_request_body(MAX_REPORT_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/citations' and EVIDENCE_CITATION_AVAILABLE:
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-
-                    from citation_generator import generate_video_citations
-                    result = generate_video_citations(
-                        self.server.cache_dir,
-                        data['video_url'],
-                        data['video_filename'],
-                        data.get('custom_info')
-                    )
+            result = create_evidence_report(
+                self.server.cache_dir,
+                data['video_url'],
+                data['video_filename'],
+                data.get('case_info')
+            )
 
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error generating citations: {e}")
-                    self.send_error(500, str(e))
+            self.send_json(dump_json_bytes(result, compact=True))
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error generating evidence report: {e}")
+            self.send_error(500, str(e))
+
+    def _post_citations(self):
+        """Generate citations for a cached video."""
+        try:
+            post_data = self.read_request_body(MAX_REPORT_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/debug_ytdlp':
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-
-                    result = execute_ytdlp_debug_command(
-                        data.get('command', ''),
-                        data.get('url', ''),
-                        self.server.logger
-                    )
+            result = generate_video_citations(
+                self.server.cache_dir,
+                data['video_url'],
+                data['video_filename'],
+                data.get('custom_info')
+            )
 
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error executing debug command: {e}")
-                    self.send_error(500, str(e))
+            self.send_json(dump_json_bytes(result, compact=True))
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error generating citations: {e}")
+            self.send_error(500, str(e))
+
+    def _post_debug_ytdlp(self):
+        """Run a yt-dlp debug command."""
+        try:
+            post_data = self.read_request_body(MAX_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/debug_mhtml':
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-
-                    result = execute_mhtml_debug_command(
-                        data.get('command', ''),
-                        data.get('url', ''),
-                        self.server.logger
-                    )
+            result = execute_ytdlp_debug_command(
+                data.get('command', ''),
+                data.get('url', ''),
+                self.server.logger
+            )
 
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error executing MHTML debug command: {e}")
-                    self.send_error(500, str(e))
+            self.send_json(dump_json_bytes(result, compact=True))
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error executing debug command: {e}")
+            self.send_error(500, str(e))
+
+    def _post_debug_mhtml(self):
+        """Run an MHTML debug command."""
+        try:
+            post_data = self.read_request_body(MAX_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/send_debug_email':
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
-
-                    # Find debug log path
-                    debug_log_path = None
-                    if self.server.logger and hasattr(self.server.logger, 'handlers'):
-                        for handler in self.server.logger.handlers:
-                            if hasattr(handler, 'baseFilename'):
-                                log_dir = Path(handler.baseFilename).parent
-                                debug_log_path = log_dir / 'debug.log'
-                                break
-
-                    result = send_debug_log_email(
-                        data.get('user_email', ''),
-                        data.get('user_name', ''),
-                        data.get('description', ''),
-                        debug_log_path,
-                        self.server.logger
-                    )
+            result = execute_mhtml_debug_command(
+                data.get('command', ''),
+                data.get('url', ''),
+                self.server.logger
+            )
 
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    self.wfile.write(json.dumps(result).encode('utf-8'))
-                except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error sending debug email: {e}")
-                    self.send_error(500, str(e))
+            self.send_json(dump_json_bytes(result, compact=True))
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error executing MHTML debug command: {e}")
+            self.send_error(500, str(e))
+
+    def _post_send_debug_email(self):
+        """Email the debug log."""
+        try:
+            post_data = self.read_request_body(MAX_REPORT_POST_SIZE)
+            if post_data is None:
                 return
+            data = load_json_bytes(post_data)
 
-            elif self.path == '/download_webpage':
-                try:
-                    content_length = int(self.headers['Content-Length'])
-                    post_data = self.rfile.read(content_length)
-                    data = json.loads(post_data.decode('utf-8'))
+            # Find debug log path
+            debug_log_path = get_debug_log_path(self.server.logger)
 
-                    url = data.get('url', '').strip()
-                    if not url:
-                        self.send_error(400, "URL is required")
-                        return
+            result = send_debug_log_email(
+                data.get('user_email', ''),
+                data.get('user_name', ''),
+                data.get('description', ''),
+                debug_log_path,
+                self.server.logger
+            )
 
-                    safe_log(self.server.logger, 'info', f"Webpage download requested: {url}")
+            self.send_json(dump_json_bytes(result, compact=True))
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error sending debug email: {e}")
+            self.send_error(500, str(e))
 
-                    # Download webpage in background thread
-                    def download_async():
-                        try:
-                            result = download_webpage(url, self.server.cache_dir, self.server.webpage_manager, self.server.logger)
-                            safe_log(self.server.logger, 'info', f"Webpage download completed: {result[0] if result[0] else 'Failed'}")
-                        except Exception as e:
-                            safe_log(self.server.logger, 'error', f"Error in webpage download thread: {e}")
+    def _post_download_webpage(self):
+        """Start archiving a webpage in the background."""
+        try:
+            post_data = self.read_request_body(MAX_POST_SIZE)
+            if post_data is None:
+                return
+            data = load_json_bytes(post_data)
 
-                    threading.Thread(target=download_async, daemon=True).start()
+            url = data.get('url', '').strip()
+            if not url:
+                self.send_error(400, "URL is required")
+                return
 
-                    # Send immediate response
-                    self.send_response(200)
-                    self.send_header('Content-type', 'application/json')
-                    self.end_headers()
-                    response = {"status": "Webpage download started", "url": url}
-                    self.wfile.write(json.dumps(response).encode('utf-8'))
+            safe_log(self.server.logger, 'info', f"Webpage download requested: {url}")
 
+            # Download webpage in background thread
+            def download_async():
+                try:
+                    result = download_webpage(url, self.server.cache_dir, self.server.webpage_manager, self.server.logger)
+                    safe_log(self.server.logger, 'info', f"Webpage download completed: {result[0] if result[0] else 'Failed'}")
                 except Exception as e:
-                    safe_log(self.server.logger, 'error', f"Error in download_webpage: {e}")
-                    self.send_error(500, str(e))
+                    safe_log(self.server.logger, 'error', f"Error in webpage download thread: {e}")
+
+            threading.Thread(target=download_async, daemon=True).start()
+
+            # Send immediate response
+            response = {"status": "Webpage download started", "url": url}
+            self.send_json(dump_json_bytes(response, compact=True))
+
+        except Exception as e:
+            safe_log(self.server.logger, 'error', f"Error in download_webpage: {e}")
+            self.send_error(500, str(e))
+
+    # POST endpoints keyed by path (query string excluded)
+    POST_ROUTES = {
+        '/shutdown': _post_shutdown,
+        '/quality_settings': _post_quality_settings,
+        '/clear_metadata_cache': _post_clear_metadata_cache,
+        '/remove': _post_remove,
+        '/remove_webpage': _post_remove_webpage,
+        '/debug_ytdlp': _post_debug_ytdlp,
+        '/debug_mhtml': _post_debug_mhtml,
+        '/send_debug_email': _post_send_debug_email,
+        '/download_webpage': _post_download_webpage,
+    }
+    # Without the generators these paths fall through to the default 404
+    if EVIDENCE_CITATION_AVAILABLE:
+        POST_ROUTES['/evidence_reports'] = _post_evidence_reports
+        POST_ROUTES['/citations'] = _post_citations
+
+    def do_POST(self):
+        try:
+            handler = self.POST_ROUTES.get(self.path.partition('?')[0])
+            if handler is not None:
+                handler(self)
                 return
 
             # Default POST handling
             self.send_error(404, "Not found")
 
-        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError, OSError) as e:
-            # Normal network disconnection - don't log as error unless in debug mode
-            if DEBUG_MODE:
-                safe_log(self.server.logger, 'info', f"Client disconnected during POST: {e}")
-            # Otherwise, silently ignore these common network events
         except Exception as e:
+            if isinstance(e, OSError) and is_client_disconnect(e):
+                # Normal network disconnection - don't log as error unless in debug mode
+                if DEBUG_MODE:
+                    safe_log(self.server.logger, 'info', f"Client disconnected during POST: {e}")
+                return
             safe_log(self.server.logger, 'error', f"Error in do_POST: {e}")
             if DEBUG_MODE:
                 traceback.print_exc()
@@ -2802,10 +3753,209 @@ class MucacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
             except Exception:
                 pass
 
+class VideoFileIndex:
+    """Lowercase name/stem index of the playable files in a directory.
+    
+    The index is rebuilt only when the directory's mtime changes, so serving
+    a video does not have to rescan the cache directory on every request.
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._index = {}
+        self._entries = []
+    
+    def _refresh(self):
+        """Rebuild the index if the directory changed since the last scan."""
+        mtime = os.stat(self.directory).st_mtime_ns
+        with self._lock:
+            if mtime == self._mtime:
+                return
+            index = {}
+            entries = []
+            with os.scandir(self.directory) as it:
+                for entry in it:
+                    stem, ext = os.path.splitext(entry.name)
+                    if ext not in _PLAYABLE_VIDEO_SUFFIXES or not entry.is_file():
+                        continue
+                    path = Path(entry.path)
+                    index.setdefault(entry.name.lower(), path)
+                    index.setdefault(stem.lower(), path)
+                    entries.append((stem.lower(), path))
+            self._index, self._entries, self._mtime = index, entries, mtime
+    
+    def lookup(self, *names):
+        """Return the first file whose lowercase name or stem matches one of names."""
+        self._refresh()
+        index = self._index
+        for name in names:
+            path = index.get(name.lower())
+            if path is not None:
+                return path
+        return None
+    
+    def find_similar(self, *base_names):
+        """Return the first file whose stem contains, or is contained in, one of base_names."""
+        self._refresh()
+        lowered = [name.lower() for name in base_names]
+        for stem, path in self._entries:
+            for name in lowered:
+                if name in stem or stem in name:
+                    return path
+        return None
+    
+    def names(self):
+        """Return the names of the indexed files."""
+        self._refresh()
+        return [path.name for _, path in self._entries]
+
+class StaticPageCache:
+    """In-memory copies of the HTML pages, plain and gzip-compressed.
+    
+    Each page is re-read only when its mtime changes, so a request costs a
+    single stat instead of an open, decode and re-encode. The ETag is weak
+    because the plain and gzipped bodies share it.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pages = {}  # path -> (mtime_ns, body, gzipped body, etag)
+    
+    def get(self, path):
+        """Return (body, gzipped_body, etag) for path; raises FileNotFoundError if missing."""
+        mtime = os.stat(path).st_mtime_ns
+        with self._lock:
+            cached = self._pages.get(path)
+            if cached is not None and cached[0] == mtime:
+                return cached[1:]
+        with open(path, 'rb') as f:
+            # Key the copy on the mtime of the file actually read, not the earlier stat
+            mtime = os.fstat(f.fileno()).st_mtime_ns
+            body = f.read()
+        gzipped = gzip.compress(body, 6)
+        etag = 'W/"%x-%x"' % (mtime, len(body))
+        with self._lock:
+            self._pages[path] = (mtime, body, gzipped, etag)
+        return body, gzipped, etag
+
+class DownloadJobs:
+    """Bounded pool for background downloads, polled by job id."""
+    
+    def __init__(self, max_workers=None, max_finished=200):
+        if max_workers is None:
+            max_workers = max(2, (os.cpu_count() or 2) - 1)
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers,
+                                                               thread_name_prefix='mucache-download')
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._jobs = {}  # job id -> (url, future), in submission order
+        self._active = {}  # url -> id of its queued or running job
+        self.max_finished = max_finished
+    
+    def submit(self, url, fn, *args):
+        """Run fn(*args) in the pool and return its job id.
+        
+        Submitting a URL that is still queued or downloading returns the
+        existing job instead of starting a second download.
+        """
+        with self._lock:
+            job_id = self._active.get(url)
+            if job_id is not None and not self._jobs[job_id][1].done():
+                return job_id
+            future = self._executor.submit(fn, *args)
+            job_id = str(next(self._ids))
+            self._jobs[job_id] = (url, future)
+            self._active[url] = job_id
+            self._prune()
+        return job_id
+    
+    def _prune(self):
+        """Forget the oldest finished jobs past max_finished."""
+        finished = [job_id for job_id, (_, future) in self._jobs.items() if future.done()]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            url, _ = self._jobs.pop(job_id)
+            if self._active.get(url) == job_id:
+                del self._active[url]
+    
+    def get(self, job_id):
+        """Return (url, future) for job_id, or None if unknown."""
+        with self._lock:
+            return self._jobs.get(job_id)
+    
+    def shutdown(self):
+        """Stop accepting jobs and drop the ones that have not started."""
+        if sys.version_info >= (3, 9):
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._executor.shutdown(wait=False)
+
 class ThreadedHTTPServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
-    """Handle requests in a separate thread."""
+    """Handle requests on a bounded pool of daemon worker threads.
+    
+    Workers are started on demand up to max_workers and then reused; further
+    connections wait in a queue instead of each getting a new thread. Daemon
+    workers keep a long download or video stream from blocking exit.
+    """
     daemon_threads = True
-    allow_reuse_address = True
+    # On Windows SO_REUSEADDR lets a second server bind over a live one, which
+    # would hide a port conflict; elsewhere it only skips TIME_WAIT sockets.
+    allow_reuse_address = os.name != 'nt'
+    max_workers = 32
+    # Each open /events stream pins a worker; cap them so video streams are never starved
+    max_event_streams = max_workers // 4
+
+    def __init__(self, *args, **kwargs):
+        self._request_queue = queue.Queue()
+        self._workers = []
+        self._idle_workers = 0
+        self._event_streams = 0
+        self._workers_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def open_event_stream(self):
+        """Reserve a worker for a long-lived /events stream; False when the cap is reached."""
+        with self._workers_lock:
+            if self._event_streams >= self.max_event_streams:
+                return False
+            self._event_streams += 1
+            return True
+
+    def close_event_stream(self):
+        """Release a slot taken by open_event_stream()."""
+        with self._workers_lock:
+            self._event_streams -= 1
+
+    def process_request(self, request, client_address):
+        """Queue the connection, starting another worker if all are busy."""
+        with self._workers_lock:
+            if self._idle_workers == 0 and len(self._workers) < self.max_workers:
+                worker = threading.Thread(target=self._worker_loop, daemon=True,
+                                          name=f'mucache-http-{len(self._workers) + 1}')
+                self._workers.append(worker)
+                self._idle_workers += 1
+                worker.start()
+            self._idle_workers -= 1
+        self._request_queue.put((request, client_address))
+
+    def _worker_loop(self):
+        while True:
+            item = self._request_queue.get()
+            if item is None:
+                return
+            try:
+                self.process_request_thread(*item)
+            finally:
+                with self._workers_lock:
+                    self._idle_workers += 1
+
+    def server_close(self):
+        super().server_close()
+        with self._workers_lock:
+            workers = len(self._workers)
+        for _ in range(workers):
+            self._request_queue.put(None)
 
 def main():
     """Main application entry point with comprehensive error handling."""
@@ -2827,13 +3977,12 @@ def main():
         
         # Initialize cache directory
         try:
-            cache_dir = Path.home() / "Downloads" / "mucache" / "data"
+            cache_dir = CACHE_DIR
             cache_dir.mkdir(parents=True, exist_ok=True)
             
-            # Test write permissions
-            test_file = cache_dir / ".write_test"
-            test_file.write_text("test")
-            test_file.unlink()
+            # Check write permissions
+            if not os.access(cache_dir, os.W_OK):
+                raise PermissionError(cache_dir)
             
         except PermissionError:
             print("ERROR: Permission denied creating cache directory")
@@ -2857,26 +4006,24 @@ def main():
         except Exception:
             safe_log(logger, 'warning', "Could not determine yt-dlp version")
         
-        # Check port availability
+        # Bind the port up front; a busy port surfaces as EADDRINUSE here
         try:
-            import socket
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            result = sock.connect_ex(('127.0.0.1', 8000))
-            sock.close()
-            
-            if result == 0:
+            server = ThreadedHTTPServer(("", 8000), MucacheHTTPRequestHandler)
+        except OSError as e:
+            if e.errno in (errno.EADDRINUSE, getattr(errno, 'WSAEADDRINUSE', None)):
                 safe_log(logger, 'error', "Port 8000 is already in use!")
                 print("ERROR: Port 8000 is already in use. Please close any other applications using this port.")
-                input("Press Enter to exit...")
-                return 1
-        except Exception as e:
-            if DEBUG_MODE:
-                safe_log(logger, 'warning', f"Could not check port availability: {e}")
+            else:
+                safe_log(logger, 'critical', f"Critical server error: {e}")
+                print(f"CRITICAL ERROR: Could not start server: {e}")
+            input("Press Enter to exit...")
+            return 1
         
         # Initialize components
         try:
             manager = VideoManager(cache_dir)
             webpage_manager = WebpageManager(cache_dir)
+            set_metadata_cache(MetadataCache(cache_dir / 'metadata_cache.json'))
             ffmpeg_plugin = FFmpegPlugin(logger)
 
             # Repair playlist if needed (fix filename mismatches)
@@ -2886,18 +4033,26 @@ def main():
         except Exception as e:
             safe_log(logger, 'critical', f"Failed to initialize components: {e}")
             print(f"CRITICAL ERROR: Failed to initialize application components: {e}")
+            server.server_close()
             input("Press Enter to exit...")
             return 1
         
         # Start the web server
         try:
-            server = ThreadedHTTPServer(("", 8000), MucacheHTTPRequestHandler)
             server.cache_dir = cache_dir
             server.video_manager = manager
             server.webpage_manager = webpage_manager
             server.ffmpeg_plugin = ffmpeg_plugin
+            server.video_index = VideoFileIndex(cache_dir)
+            server.page_cache = StaticPageCache()
+            server.download_jobs = DownloadJobs()
+            server.shutdown_event = threading.Event()
             server.logger = logger
             
+            # service.sh stops us with SIGTERM; treat it like Ctrl+C so the
+            # finally below still flushes the playlist and drains the file writer
+            signal.signal(signal.SIGTERM, lambda *_: server.shutdown_event.set())
+            
             safe_log(logger, 'info', "Starting HTTP server on port 8000...")
             
             # Start server in thread
@@ -2922,10 +4077,12 @@ def main():
                 print("DEBUG MODE: All log messages will be shown")
             print("Press Ctrl+C to stop the server")
             
-            # Keep the main thread alive
+            # Keep the main thread alive until /shutdown or Ctrl+C. Windows only
+            # delivers Ctrl+C between waits, so poll there; elsewhere block outright.
             try:
-                while True:
-                    threading.Event().wait(1)
+                idle_timeout = 1 if os.name == 'nt' else None
+                while not server.shutdown_event.wait(idle_timeout):
+                    pass
             except KeyboardInterrupt:
                 safe_log(logger, 'info', "Shutdown requested by user")
                 console_status("Shutting down application...")
@@ -2935,6 +4092,10 @@ def main():
                     safe_log(logger, 'info', "Server shutdown complete")
                 except Exception:
                     pass
+                server.download_jobs.shutdown()
+                manager.close()
+                # Drain queued log records before the interpreter starts tearing down
+                stop_log_listener()
             
             return 0
             